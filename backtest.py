@@ -0,0 +1,224 @@
+"""
+Historical verdict reconstruction and DCA backtest.
+Applies the SIGNAL_REGISTRY zone rules and compute_overall_verdict()
+logic to stored indicator histories, producing a dated verdict timeline for
+as far back as the inputs exist — without calling get_all_signals per day.
+
+Reconstructable inputs:
+    price-derived   Mayer, 200W heatmap, 2-year MA multiplier, Ahr999,
+                    RSI-14, weekly RSI, Pi Cycle   (indicator_engine over the OHLCV store)
+    macro           GLI YoY                         (fred_store mirror)
+    sentiment       Fear & Greed                    (alternative.me full history)
+On-chain, dominance, altcoin season, CBBI, DXY and SPX have no stored
+history; on each date the verdict is computed over the signals that do
+exist (n_signals), so the score is comparable in proportion, not in count.
+
+Zone codes: 0 = BUY, 1 = CAUTION, 2 = SELL, -1 = no data.
+
+Running standalone:
+    python3 backtest.py [since YYYY-MM-DD] [weekly DCA amount]
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_fetcher import (SIGNAL_REGISTRY, SIGNAL_THRESHOLDS, ZONE_BUY as BUY,
+                          ZONE_CAUTION as CAUTION, ZONE_SELL as SELL)
+
+ZONE_LABELS = {BUY: 'BUY', CAUTION: 'CAUTION', SELL: 'SELL'}
+
+VERDICTS = [
+    'High Historical Value Zone',
+    'Value Accumulation Zone',
+    'Elevated Risk Zone',
+    'High Risk Zone',
+    'Neutral Data Zone',
+]
+
+# Same multipliers as the Signal-Adjusted DCA tab in app.py
+DCA_MULT = {
+    'High Historical Value Zone': 1.5,
+    'Value Accumulation Zone':    1.0,
+    'Neutral Data Zone':          0.5,
+    'Elevated Risk Zone':         0.25,
+    'High Risk Zone':             0.0,
+}
+
+MIN_SIGNALS = 5   # dates with fewer reconstructable signals are dropped
+
+# Signals with a history column in load_inputs(), in registry order
+HISTORY_SIGNALS = [spec for spec in SIGNAL_REGISTRY if spec.history]
+
+# signal name → input column, for the classify_signal-style (threshold) signals
+THRESHOLD_COLUMNS = {spec.name: spec.history for spec in HISTORY_SIGNALS if spec.thresholds}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Inputs
+# ─────────────────────────────────────────────────────────────────────────────
+
+def fear_greed_history():
+    """Full daily Fear & Greed history as a Series indexed by date (empty on failure)."""
+    from data_fetcher import _get   # the fetch layer (source cache + conditional GET)
+    try:
+        d = _get("https://api.alternative.me/fng/?limit=0&format=json")
+        entries = (d or {}).get('data', [])
+        if entries:
+            s = pd.Series([float(e['value']) for e in entries],
+                          index=pd.to_datetime([int(e['timestamp']) for e in entries], unit='s').normalize())
+            return s[~s.index.duplicated(keep='first')].sort_index()
+    except Exception as e:
+        print(f"[backtest] Fear & Greed history unavailable: {e}")
+    return pd.Series(dtype='float64')
+
+
+def gli_yoy_history(dates):
+    """GLI YoY % on each date from the local FRED mirror (NaN where unavailable)."""
+    try:
+        import fred_store
+        days = np.asarray(dates.values.astype('datetime64[D]'))
+        now = fred_store.gli_at(days)
+        ago = fred_store.gli_at(days - np.timedelta64(365, 'D'))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (now - ago) / ago * 100
+    except Exception as e:
+        print(f"[backtest] GLI history unavailable: {e}")
+        return np.full(len(dates), np.nan)
+
+
+def load_inputs(with_fear_greed=True, with_gli=True):
+    """
+    One row per stored daily bar with every reconstructable indicator value.
+    May hit the network for the Fear & Greed history (source-cached).
+    """
+    import indicator_engine
+    frame = indicator_engine.full_history()
+    if frame.empty:
+        return frame
+    inputs = frame[['close', 'mayer', 'pct_above_200w', 'ma_2yr_ratio', 'rsi_14', 'rsi_weekly',
+                    'pi_ratio', 'pi_triggered', 'ma_200d']].copy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Same approximation as get_all_indicators
+        inputs['ahr999'] = inputs['mayer'] * (inputs['close'] / (inputs['ma_200d'] * 0.85))
+    # Pi Cycle only exists once both MAs do
+    inputs['pi_triggered'] = np.where(inputs['pi_ratio'].isna(), np.nan,
+                                      inputs['pi_triggered'].astype('float64'))
+    inputs['fear_greed'] = (fear_greed_history().reindex(inputs.index).to_numpy()
+                            if with_fear_greed else np.nan)
+    inputs['gli_yoy'] = gli_yoy_history(inputs.index) if with_gli else np.nan
+    return inputs
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Vectorized classification
+# ─────────────────────────────────────────────────────────────────────────────
+
+def signal_zones(inputs, thresholds=None):
+    """DataFrame of zone codes, one column per reconstructable signal (SignalSpec.zones)."""
+    thresholds = thresholds or SIGNAL_THRESHOLDS
+    return pd.DataFrame({spec.name: spec.zones(inputs, thresholds.get(spec.name))
+                         for spec in HISTORY_SIGNALS}, index=inputs.index)
+
+
+def verdicts_from_zones(z):
+    """
+    compute_overall_verdict() over each row of a zone-code matrix.
+    Returns (verdict_idx into VERDICTS, score, buy_n, caution_n, sell_n, total), NaN-free.
+    """
+    z = np.asarray(z)
+    return verdicts_from_counts((z == BUY).sum(axis=1), (z == CAUTION).sum(axis=1), (z == SELL).sum(axis=1))
+
+
+def verdicts_from_counts(buy_n, caution_n, sell_n):
+    """verdicts_from_zones() from per-date zone counts; broadcasts over any shape."""
+    buy_n, caution_n, sell_n = np.broadcast_arrays(buy_n, caution_n, sell_n)
+    total = buy_n + caution_n + sell_n
+    safe = np.maximum(total, 1)
+    buy_pct = buy_n / safe * 100
+    sell_frac = sell_n / safe
+
+    # Same branch order as compute_overall_verdict
+    conds = [buy_pct >= 60, buy_pct >= 40, sell_frac >= 0.4, sell_frac >= 0.6]
+    verdict = np.select(conds, [0, 1, 2, 3], default=4)
+    score = np.select(conds, [buy_pct, buy_pct, 100 - sell_frac * 100, 100 - sell_frac * 100], default=50.0)
+    return verdict, score, buy_n, caution_n, sell_n, total
+
+
+def reconstruct(inputs, since=None, min_signals=MIN_SIGNALS, thresholds=None):
+    """Dated verdict timeline from load_inputs() rows. Pure NumPy; no network."""
+    if inputs is None or inputs.empty:
+        return pd.DataFrame()
+    z = signal_zones(inputs, thresholds)
+    verdict, score, buy_n, caution_n, sell_n, total = verdicts_from_zones(z.to_numpy())
+    out = z.copy()
+    out['close'] = inputs['close'].to_numpy()
+    out['buy_n'], out['caution_n'], out['sell_n'], out['n_signals'] = buy_n, caution_n, sell_n, total
+    out['score'] = score
+    out['verdict'] = np.asarray(VERDICTS, dtype=object)[verdict]
+    out = out[total >= min_signals]
+    if since is not None:
+        out = out[out.index >= pd.Timestamp(since)]
+    return out
+
+
+def verdict_timeline(since=None, min_signals=MIN_SIGNALS):
+    """load_inputs() + reconstruct()."""
+    return reconstruct(load_inputs(), since=since, min_signals=min_signals)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DCA backtest
+# ─────────────────────────────────────────────────────────────────────────────
+
+def simulate_dca(timeline, weekly_amount=100.0, multipliers=None):
+    """
+    Weekly Monday buys at the daily close: standard DCA vs amounts scaled by
+    that day's reconstructed verdict. Valued at the last close in `timeline`.
+    """
+    multipliers = multipliers or DCA_MULT
+    if timeline.empty:
+        return {}
+    mondays = timeline[timeline.index.dayofweek == 0]
+    close = mondays['close'].to_numpy(dtype='float64')
+    mult = mondays['verdict'].map(multipliers).fillna(0.5).to_numpy(dtype='float64')
+    last = float(timeline['close'].iloc[-1])
+
+    std_btc = float((weekly_amount / close).sum())
+    adj_amounts = weekly_amount * mult
+    adj_btc = float((adj_amounts / close).sum())
+    std_invested = weekly_amount * len(close)
+    adj_invested = float(adj_amounts.sum())
+    std_value, adj_value = std_btc * last, adj_btc * last
+    return {
+        'weeks':          len(close),
+        'std_invested':   std_invested,
+        'std_value':      std_value,
+        'std_return_pct': (std_value / std_invested - 1) * 100 if std_invested else 0.0,
+        'adj_invested':   adj_invested,
+        'adj_value':      adj_value,
+        'adj_return_pct': (adj_value / adj_invested - 1) * 100 if adj_invested else 0.0,
+        'outperformance_pct': (((adj_value / adj_invested) / (std_value / std_invested)) - 1) * 100
+                              if adj_invested and std_invested and std_value else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    args = sys.argv[1:]
+    since = args[0] if args else None
+    amount = float(args[1]) if len(args) > 1 else 100.0
+
+    inputs = load_inputs()
+    t0 = time.perf_counter()
+    timeline = reconstruct(inputs, since=since)
+    elapsed = (time.perf_counter() - t0) * 1000
+    if timeline.empty:
+        print("[backtest] No history available.")
+        sys.exit(1)
+    print(f"[backtest] {len(timeline)} days {timeline.index[0].date()} → {timeline.index[-1].date()} "
+          f"reconstructed in {elapsed:.1f} ms")
+    print(timeline['verdict'].value_counts().to_string())
+    for k, v in simulate_dca(timeline, amount).items():
+        print(f"  {k:<20} {v:,.2f}")
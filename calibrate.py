@@ -0,0 +1,268 @@
+"""
+Threshold calibration sweep.
+Sweeps grids of buy/caution cutoffs for each reconstructable signal over the
+stored history and scores every configuration, so proposed threshold changes
+can be reviewed against the data before SIGNAL_THRESHOLDS is edited.
+
+For each configuration only the swept signal's thresholds change; every
+other signal keeps its current cutoffs, and the verdict is recomputed with
+backtest's compute_overall_verdict logic. Scores:
+    dca        signal-adjusted DCA outperformance vs plain weekly DCA (%)
+    forward    mean forward return on days the signal says BUY minus on
+               days it says SELL (%, over --horizon days)
+
+Within one signal the whole grid is classified in a single broadcast call
+(classify_signal_array with a column of thresholds); the grid is split into
+chunks that run on a process pool across all cores.
+
+Only signals with stored history can be swept (see backtest.THRESHOLD_COLUMNS):
+on-chain cutoffs such as MVRV or Puell have no local history to test against.
+
+Running standalone:
+    python3 calibrate.py                              <- sweep every signal, DCA score
+    python3 calibrate.py "Mayer Multiple" --score forward --horizon 180
+    options: --since YYYY-MM-DD  --horizon DAYS  --score dca|forward
+             --workers N  --top N  --out report.json
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import backtest
+from data_fetcher import (SIGNAL_THRESHOLDS, classify_signal_array, ZONE_BUY, ZONE_CAUTION,
+                          ZONE_SELL, ZONE_MISSING)
+
+HORIZON_DAYS  = 365
+CHUNK_SIZE    = 64       # configurations per pool task
+WEEKLY_AMOUNT = 100.0
+
+# signal → (buy_max grid, caution_max grid); pairs that cross are skipped
+GRIDS = {
+    'Fear & Greed Index':   (np.arange(10, 41, 5),        np.arange(45, 81, 5)),
+    'Mayer Multiple':       (np.arange(0.6, 1.01, 0.05),  np.arange(1.1, 2.41, 0.1)),
+    '200-Week MA Heatmap':  (np.arange(-20, 41, 10),      np.arange(50, 251, 25)),
+    '2-Year MA Multiplier': (np.arange(0.6, 1.21, 0.1),   np.arange(1.5, 5.01, 0.5)),
+    'Ahr999 Index':         (np.arange(0.3, 0.81, 0.05),  np.arange(0.9, 2.01, 0.1)),
+    'RSI (14-Day)':         (np.arange(20, 41, 5),        np.arange(60, 86, 5)),
+    'RSI Weekly':           (np.arange(25, 46, 5),        np.arange(55, 86, 5)),
+}
+
+_prep = None   # per-worker copy of prepare(), set by _init_worker
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Grid
+# ─────────────────────────────────────────────────────────────────────────────
+
+def grid_for(name):
+    """[(buy_max, caution_max), ...] for one signal, keeping the zones ordered."""
+    buys, cautions = GRIDS[name]
+    invert = SIGNAL_THRESHOLDS[name].get('invert', False)
+    return [(round(float(b), 6), round(float(c), 6))
+            for b in buys for c in cautions
+            if (b > c if invert else b < c)]
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Scoring (runs in the worker processes)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _init_worker(prep):
+    global _prep
+    _prep = prep
+
+
+def prepare(inputs, since=None, horizon=HORIZON_DAYS, min_signals=backtest.MIN_SIGNALS):
+    """
+    Everything the scorer needs as plain arrays: zone counts of the current
+    thresholds, forward returns, the Monday buy mask and the rows kept.
+    """
+    z = backtest.signal_zones(inputs)
+    codes = z.to_numpy()
+    close = inputs['close'].to_numpy(dtype='float64')
+    keep = (codes != ZONE_MISSING).sum(axis=1) >= min_signals
+    if since is not None:
+        keep &= inputs.index >= pd.Timestamp(since)
+    fwd = np.full(len(close), np.nan)
+    if len(close) > horizon:
+        fwd[:-horizon] = (close[horizon:] / close[:-horizon] - 1) * 100
+    return {
+        'zones':   z.loc[keep],
+        'values':  inputs.loc[keep],
+        'close':   close[keep],
+        'fwd':     fwd[keep],
+        'mondays': np.asarray(inputs.index[keep].dayofweek == 0),
+    }
+
+
+def score_configs(name, configs, prep=None):
+    """
+    Score a list of (buy_max, caution_max) for one signal. The whole list is
+    classified at once: thresholds are a (k, 1) column against the (n,) history.
+    """
+    prep = prep if prep is not None else _prep
+    col = backtest.THRESHOLD_COLUMNS[name]
+    values = prep['values'][col].to_numpy(dtype='float64')
+    invert = SIGNAL_THRESHOLDS[name].get('invert', False)
+    cfg = np.asarray(configs, dtype='float64')
+    z = classify_signal_array(values, cfg[:, :1], cfg[:, 1:], invert=invert, nan_zone=ZONE_MISSING)
+
+    # Zone counts of every other signal are fixed; add the swept signal per configuration
+    others = prep['zones'].drop(columns=[name]).to_numpy()
+    buy_n = (others == ZONE_BUY).sum(axis=1) + (z == ZONE_BUY)
+    caution_n = (others == ZONE_CAUTION).sum(axis=1) + (z == ZONE_CAUTION)
+    sell_n = (others == ZONE_SELL).sum(axis=1) + (z == ZONE_SELL)
+    verdict = backtest.verdicts_from_counts(buy_n, caution_n, sell_n)[0]
+
+    # Signal-adjusted DCA, valued at the last close (same as backtest.simulate_dca)
+    mult = np.array([backtest.DCA_MULT[v] for v in backtest.VERDICTS])[verdict]
+    close, mondays = prep['close'], prep['mondays']
+    last = close[-1]
+    std_invested = WEEKLY_AMOUNT * mondays.sum()
+    std_value = (WEEKLY_AMOUNT / close[mondays]).sum() * last
+    adj_amounts = WEEKLY_AMOUNT * mult[:, mondays]
+    adj_invested = adj_amounts.sum(axis=1)
+    adj_value = (adj_amounts / close[mondays]).sum(axis=1) * last
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dca = ((adj_value / adj_invested) / (std_value / std_invested) - 1) * 100
+
+    # Forward returns by the swept signal's own zone
+    fwd = prep['fwd']
+    has_fwd = ~np.isnan(fwd)
+    fwd0 = np.where(has_fwd, fwd, 0.0)
+    is_buy = (z == ZONE_BUY) & has_fwd
+    is_sell = (z == ZONE_SELL) & has_fwd
+    buy_days, sell_days = is_buy.sum(axis=1), is_sell.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        buy_fwd = (is_buy * fwd0).sum(axis=1) / buy_days
+        sell_fwd = (is_sell * fwd0).sum(axis=1) / sell_days
+
+    rows = []
+    for i, (b, c) in enumerate(configs):
+        rows.append({
+            'signal':      name,
+            'buy_max':     b,
+            'caution_max': c,
+            'dca':         float(dca[i]),
+            'forward':     float(buy_fwd[i] - sell_fwd[i]),
+            'buy_fwd':     float(buy_fwd[i]),
+            'sell_fwd':    float(sell_fwd[i]),
+            'buy_days':    int(buy_days[i]),
+            'sell_days':   int(sell_days[i]),
+        })
+    return rows
+
+
+def _score_task(task):
+    return score_configs(*task)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sweep
+# ─────────────────────────────────────────────────────────────────────────────
+
+def sweep(signals=None, since=None, horizon=HORIZON_DAYS, workers=None, inputs=None):
+    """Score every grid configuration for `signals` (default: all of GRIDS). Returns the rows."""
+    signals = list(signals or GRIDS)
+    unknown = [s for s in signals if s not in GRIDS]
+    if unknown:
+        raise ValueError(f"no sweep grid for {unknown}; choose from {list(GRIDS)}")
+    if inputs is None:
+        inputs = backtest.load_inputs()
+    if inputs.empty:
+        return []
+    prep = prepare(inputs, since=since, horizon=horizon)
+    if not len(prep['close']):
+        return []
+    tasks = [(name, chunk) for name in signals for chunk in _chunks(grid_for(name), CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(prep,)) as pool:
+        for chunk_rows in pool.map(_score_task, tasks):
+            rows.extend(chunk_rows)
+    return rows
+
+
+def baseline(signals=None, since=None, horizon=HORIZON_DAYS, inputs=None):
+    """Scores of the thresholds currently in SIGNAL_THRESHOLDS, for comparison."""
+    if inputs is None:
+        inputs = backtest.load_inputs()
+    prep = prepare(inputs, since=since, horizon=horizon)
+    return {name: score_configs(name, [(SIGNAL_THRESHOLDS[name]['buy_max'],
+                                        SIGNAL_THRESHOLDS[name]['caution_max'])], prep)[0]
+            for name in (signals or GRIDS)}
+
+
+def rank(rows, score='dca', top=10):
+    """{signal: best `top` rows by `score`}, NaN scores last."""
+    by_signal = {}
+    for r in rows:
+        by_signal.setdefault(r['signal'], []).append(r)
+    key = lambda r: -np.inf if np.isnan(r[score]) else r[score]
+    return {name: sorted(rs, key=key, reverse=True)[:top] for name, rs in by_signal.items()}
+
+
+def format_report(ranked, current, score='dca'):
+    lines = []
+    for name, rows in ranked.items():
+        cur = current.get(name)
+        lines.append(f"\n{name}")
+        if cur:
+            lines.append(f"  current  buy ≤ {cur['buy_max']:<8g} caution ≤ {cur['caution_max']:<8g} "
+                         f"dca {cur['dca']:+7.2f}%  forward {cur['forward']:+8.2f}%  "
+                         f"(BUY {cur['buy_days']}d / SELL {cur['sell_days']}d)")
+        for i, r in enumerate(rows, 1):
+            lines.append(f"  #{i:<6} buy ≤ {r['buy_max']:<8g} caution ≤ {r['caution_max']:<8g} "
+                         f"dca {r['dca']:+7.2f}%  forward {r['forward']:+8.2f}%  "
+                         f"(BUY {r['buy_days']}d / SELL {r['sell_days']}d)")
+    lines.append(f"\nRanked by {score}; inverted signals read 'buy ≥ / caution ≥'.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+    args = sys.argv[1:]
+    opts = {'since': None, 'horizon': HORIZON_DAYS, 'score': 'dca', 'workers': None, 'top': 10, 'out': None}
+    signals = []
+    while args:
+        a = args.pop(0)
+        if a.startswith('--') and a[2:] in opts and args:
+            opts[a[2:]] = args.pop(0)
+        else:
+            signals.append(a)
+    if opts['score'] not in ('dca', 'forward'):
+        print(f"[calibrate] Unknown score {opts['score']!r} — use dca or forward")
+        sys.exit(2)
+    horizon = int(opts['horizon'])
+    workers = int(opts['workers']) if opts['workers'] else None
+
+    inputs = backtest.load_inputs()
+    t0 = time.perf_counter()
+    try:
+        rows = sweep(signals, since=opts['since'], horizon=horizon, workers=workers, inputs=inputs)
+    except ValueError as e:
+        print(f"[calibrate] {e}")
+        sys.exit(2)
+    if not rows:
+        print("[calibrate] No history available.")
+        sys.exit(1)
+    elapsed = time.perf_counter() - t0
+    print(f"[calibrate] {len(rows)} configurations scored in {elapsed:.1f}s")
+
+    ranked = rank(rows, opts['score'], int(opts['top']))
+    current = baseline(signals, since=opts['since'], horizon=horizon, inputs=inputs)
+    print(format_report(ranked, current, opts['score']))
+    if opts['out']:
+        with open(opts['out'], 'w') as f:
+            json.dump({'score': opts['score'], 'horizon': horizon, 'since': opts['since'],
+                       'current': current, 'ranked': ranked}, f, indent=2)
+        print(f"[calibrate] Report written to {opts['out']}")
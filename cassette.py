@@ -0,0 +1,163 @@
+"""
+Record / replay of upstream HTTP traffic.
+Every request made through http_client (Yahoo, CoinGecko, alternative.me,
+CoinGlass, FRED, CBBI, Frankfurter, Telegram) can be written to a cassette
+directory and served back later, so get_all_indicators runs offline and
+reproducibly for benchmarking and profiling.
+
+Selected by environment variables:
+    CASSETTE_MODE=record|replay    off when unset
+    CASSETTE_DIR=<path>            default .cassettes/default
+    CASSETTE_LATENCY=1             replay sleeps for each recorded duration
+
+Each distinct request (method + URL + params + JSON body, secrets stripped)
+is one JSON file holding the responses in the order they were seen; replay
+serves them in the same order and repeats the last one once exhausted. A
+request with no recording raises requests.ConnectionError, so callers take
+their normal fallback path.
+
+While a cassette is active, the on-disk stores (source cache, OHLCV, FRED
+mirror) live in a throwaway directory, so record and replay both start
+cold and issue the same requests.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MODE    = os.environ.get('CASSETTE_MODE', '').strip().lower()
+DIR     = os.environ.get('CASSETTE_DIR') or os.path.join(os.path.dirname(__file__), '.cassettes', 'default')
+LATENCY = os.environ.get('CASSETTE_LATENCY', '') not in ('', '0', 'false')
+
+if MODE not in ('', 'record', 'replay'):
+    print(f"[cassette] Unknown CASSETTE_MODE={MODE!r} — cassettes disabled")
+    MODE = ''
+
+_SECRET_PARAMS = {'api_key', 'apikey', 'key', 'token'}
+_TELEGRAM_TOKEN = re.compile(r'/bot[^/]+/')
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After')
+
+_lock = threading.Lock()
+_tapes = {}       # key → list of recorded interactions
+_positions = {}   # key → next index to replay
+_state_root = None
+
+
+def active():
+    return MODE in ('record', 'replay')
+
+
+def recording():
+    return MODE == 'record'
+
+
+def replaying():
+    return MODE == 'replay'
+
+
+def isolated_dir(default):
+    """`default` normally; a per-process temp directory while a cassette is active."""
+    global _state_root
+    if not active():
+        return default
+    with _lock:
+        if _state_root is None:
+            _state_root = tempfile.mkdtemp(prefix='cassette-state-')
+    return os.path.join(_state_root, os.path.basename(default))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Keys and storage
+# ─────────────────────────────────────────────────────────────────────────────
+
+def request_key(method, url, params=None, json_body=None):
+    url = _TELEGRAM_TOKEN.sub('/bot<token>/', url)
+    items = sorted((k, v) for k, v in (params or {}).items() if k not in _SECRET_PARAMS)
+    key = f"{method} {url}"
+    if items:
+        key += ('&' if '?' in url else '?') + urlencode(items, doseq=True)
+    if json_body is not None:
+        key += ' ' + json.dumps(json_body, sort_keys=True, default=str)
+    return key
+
+
+def _path(key):
+    return os.path.join(DIR, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+
+def _load_tape(key):
+    if key not in _tapes:
+        try:
+            with open(_path(key)) as f:
+                _tapes[key] = json.load(f)['interactions']
+        except FileNotFoundError:
+            _tapes[key] = []
+    return _tapes[key]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Record
+# ─────────────────────────────────────────────────────────────────────────────
+
+def record(method, url, params, json_body, duration, response=None, error=None):
+    """Append one interaction (a response, or the transport error raised) to its tape."""
+    key = request_key(method, url, params, json_body)
+    entry = {'duration': round(duration, 4)}
+    if response is not None:
+        entry['status'] = response.status_code
+        entry['headers'] = {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers}
+        try:
+            entry['body'] = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['body_b64'] = base64.b64encode(response.content).decode('ascii')
+    else:
+        entry['error'] = type(error).__name__
+        entry['message'] = str(error)
+    with _lock:
+        if key not in _tapes:
+            _tapes[key] = []   # a new recording replaces whatever was on disk
+        _tapes[key].append(entry)
+        os.makedirs(DIR, exist_ok=True)
+        tmp = _path(key) + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({'key': key, 'interactions': _tapes[key]}, f)
+        os.replace(tmp, _path(key))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Replay
+# ─────────────────────────────────────────────────────────────────────────────
+
+def play(method, url, params=None, json_body=None):
+    """The next recorded response for this request, or raise what was recorded."""
+    key = request_key(method, url, params, json_body)
+    with _lock:
+        tape = _load_tape(key)
+        if not tape:
+            raise requests.ConnectionError(f"[cassette] no recording for {key}")
+        i = _positions.get(key, 0)
+        entry = tape[min(i, len(tape) - 1)]
+        _positions[key] = i + 1
+    if LATENCY:
+        time.sleep(entry.get('duration', 0))
+    if 'error' in entry:
+        exc = getattr(requests, entry['error'], requests.ConnectionError)
+        raise exc(entry.get('message', ''))
+
+    r = requests.Response()
+    r.status_code = entry['status']
+    r.headers = CaseInsensitiveDict(entry.get('headers', {}))
+    r._content = (base64.b64decode(entry['body_b64']) if 'body_b64' in entry
+                  else entry.get('body', '').encode('utf-8'))
+    r.encoding = 'utf-8'
+    r.url = url
+    return r
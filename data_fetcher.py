@@ -3,84 +3,68 @@ Bitcoin Accumulation Signal Dashboard — Data Fetcher
 Fetches live values for all key Bitcoin accumulation indicators.
 """
 
-import requests
+import fred_store
+import http_client
+import indicator_engine
+import indicator_stream
+import metrics
+import ohlcv_store
+import price_feed
+import providers
+import source_cache
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import sys
+from datetime import datetime
 import json
-
-sys.path.append('/opt/.manus/.sandbox-runtime')
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _get(url, timeout=12, params=None):
+def _fetch_json(url, timeout=None, params=None):
     try:
-        r = requests.get(url, timeout=timeout, params=params,
-                         headers={'User-Agent': 'Mozilla/5.0'})
-        r.raise_for_status()
-        return r.json()
+        return http_client.get_json(url, params=params, timeout=timeout)
     except Exception as e:
         print(f"[HTTP] {url} → {e}")
         return None
 
 
+def _get(url, timeout=None, params=None):
+    """GET JSON through the per-source TTL cache (see source_cache.SOURCE_TTLS)."""
+    return source_cache.read_through(url, params, lambda: _fetch_json(url, timeout, params))
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. Bitcoin Price & Basic Market Data
 # ─────────────────────────────────────────────────────────────────────────────
 
 def get_btc_price_and_market():
-    """Returns current price, 24h change, market cap, volume, dominance."""
+    """Returns 1y daily OHLCV, current price, 24h change and Yahoo chart meta.
+    The current price comes from the hedged multi-provider feed; the store's
+    last close is only used when every provider misses its deadline."""
+    live = price_feed.get_live_price()
     try:
-        from data_api import ApiClient
-        client = ApiClient()
-        r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': 'BTC-USD', 'interval': '1d', 'range': '1y',
-            'includeAdjustedClose': True
-        })
-        if r and 'chart' in r and 'result' in r['chart']:
-            meta = r['chart']['result'][0]['meta']
-            result = r['chart']['result'][0]
-            timestamps = result['timestamp']
-            quotes = result['indicators']['quote'][0]
-            df = pd.DataFrame({
-                'date':   [datetime.fromtimestamp(t) for t in timestamps],
-                'open':   quotes.get('open', []),
-                'high':   quotes.get('high', []),
-                'low':    quotes.get('low', []),
-                'close':  quotes.get('close', []),
-                'volume': quotes.get('volume', []),
-            }).dropna(subset=['close'])
-            df.set_index('date', inplace=True)
-
-            price = meta.get('regularMarketPrice', df['close'].iloc[-1])
-            prev  = meta.get('chartPreviousClose', df['close'].iloc[-2])
-            chg   = ((price - prev) / prev * 100) if prev else 0
-            # Enrich meta with market cap from Yahoo Finance summary
-            if 'marketCap' in meta and meta['marketCap']:
-                pass  # already present
-            else:
-                # Try to get market cap from Yahoo Finance quote summary
-                try:
-                    qs = client.call_api('YahooFinance/get_stock_insights', query={'symbol': 'BTC-USD'})
-                    if qs:
-                        pass
-                except Exception:
-                    pass
+        df = ohlcv_store.daily(days=365)
+        if len(df) >= 2:
+            meta  = ohlcv_store.meta()
+            prev  = df['close'].iloc[-2]
+            price = live['usd'] if live else meta.get('regularMarketPrice', df['close'].iloc[-1])
+            chg   = live['chg_24h'] if live and live['chg_24h'] is not None else (
+                    ((price - prev) / prev * 100) if prev else 0)
             return df, price, chg, meta
     except Exception as e:
-        print(f"Yahoo Finance error: {e}")
+        print(f"BTC OHLCV store error: {e}")
+    if live:
+        return None, live['usd'], live['chg_24h'] or 0, {}
 
-    # CoinGecko fallback
+    # CoinGecko fallback (shares the cycle's /coins/markets snapshot)
     try:
-        cg = _get("https://api.coingecko.com/api/v3/coins/bitcoin?localization=false&tickers=false&community_data=false&developer_data=false")
+        cg = get_coingecko_market()
         if cg:
-            md = cg.get('market_data', {})
-            price = md.get('current_price', {}).get('usd', 0)
-            chg   = md.get('price_change_percentage_24h', 0)
-            return None, price, chg, {}
+            return None, cg.get('current_price', 0), cg.get('price_change_percentage_24h', 0), {}
     except Exception as e:
         print(f"CoinGecko fallback error: {e}")
     return None, 67000, 0, {}
@@ -88,51 +72,21 @@ def get_btc_price_and_market():
 
 def get_btc_ohlcv_weekly(weeks=260):
     """Returns weekly OHLCV DataFrame for long-term indicator calculations.
-    Uses 10y range to ensure enough data for accurate 200-week MA (~$58k currently).
+    Resampled from the canonical daily store (10y) so the 200-week MA is accurate.
     """
     try:
-        from data_api import ApiClient
-        client = ApiClient()
-        r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': 'BTC-USD', 'interval': '1wk', 'range': '10y',
-        })
-        if r and 'chart' in r and 'result' in r['chart']:
-            result = r['chart']['result'][0]
-            timestamps = result['timestamp']
-            quotes = result['indicators']['quote'][0]
-            df = pd.DataFrame({
-                'date':   [datetime.fromtimestamp(t) for t in timestamps],
-                'close':  quotes.get('close', []),
-                'volume': quotes.get('volume', []),
-            }).dropna(subset=['close'])
-            df.set_index('date', inplace=True)
-            return df
+        return ohlcv_store.weekly()
     except Exception as e:
         print(f"Weekly OHLCV error: {e}")
-
-    # CoinGecko fallback for weekly data
-    try:
-        url = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart"
-        params = {'vs_currency': 'usd', 'days': '2000', 'interval': 'weekly'}
-        r = requests.get(url, params=params, timeout=15, headers={'User-Agent': 'Mozilla/5.0'})
-        if r.status_code == 200:
-            prices = r.json().get('prices', [])
-            df = pd.DataFrame(prices, columns=['ts', 'close'])
-            df.index = pd.to_datetime(df['ts'], unit='ms')
-            df = df[['close']].dropna()
-            df['volume'] = 0
-            return df
-    except Exception as e:
-        print(f"Weekly OHLCV CoinGecko fallback error: {e}")
     return pd.DataFrame()
 
 
 def get_btc_aud_changes():
-    """Fetch BTC/AUD 24h and 7d percentage changes independently via yfinance."""
+    """Fetch BTC/AUD 24h and 7d percentage changes independently from Yahoo BTC-AUD daily closes."""
     try:
-        import yfinance as yf
-        hist = yf.Ticker('BTC-AUD').history(period='10d', interval='1d')
-        closes = hist['Close'].dropna().tolist()
+        r = providers.chart('BTC-AUD', range_='1mo')
+        closes = [c for c in (r['chart']['result'][0]['indicators']['quote'][0].get('close') or [])
+                  if c is not None] if r else []
         if len(closes) >= 2:
             price_aud_now  = closes[-1]
             price_aud_prev = closes[-2]
@@ -150,12 +104,8 @@ def get_dxy():
     Returns (value, chg_pct, signal_str) — rising DXY = bearish for BTC.
     """
     try:
-        from data_api import ApiClient
-        client = ApiClient()
-        r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': 'DX-Y.NYB', 'interval': '1d', 'range': '1mo',
-        })
-        if r and 'chart' in r and r['chart'].get('result'):
+        r = providers.chart('DX-Y.NYB', range_='5d')
+        if r:
             meta = r['chart']['result'][0]['meta']
             price = meta.get('regularMarketPrice', 104.0)
             prev  = meta.get('chartPreviousClose', price)
@@ -164,18 +114,6 @@ def get_dxy():
     except Exception as e:
         print(f"DXY fetch error: {e}")
 
-    # Fallback: try direct Yahoo Finance
-    try:
-        r = _get("https://query1.finance.yahoo.com/v8/finance/chart/DX-Y.NYB?interval=1d&range=5d", timeout=8)
-        if r and 'chart' in r and r['chart'].get('result'):
-            meta = r['chart']['result'][0]['meta']
-            price = meta.get('regularMarketPrice', 104.0)
-            prev  = meta.get('chartPreviousClose', price)
-            chg   = ((price - prev) / prev * 100) if prev else 0
-            return price, chg
-    except Exception as e:
-        print(f"DXY fallback error: {e}")
-
     return 104.0, 0.0  # reasonable default
 
 
@@ -187,17 +125,8 @@ def get_spx_comparison():
     Negative divergence = BTC underperforming = historically a BUY signal.
     """
     try:
-        from data_api import ApiClient
-        client = ApiClient()
-
-        # BTC 90-day return
-        btc_r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': 'BTC-USD', 'interval': '1d', 'range': '6mo'
-        })
         # SPX 90-day return
-        spx_r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': '^GSPC', 'interval': '1d', 'range': '6mo'
-        })
+        spx_r = providers.chart('^GSPC', range_='6mo')
 
         def extract_90d_return(r):
             if r and 'chart' in r and r['chart'].get('result'):
@@ -209,7 +138,7 @@ def get_spx_comparison():
                     return (end - start) / start * 100 if start else 0
             return None
 
-        btc_90d = extract_90d_return(btc_r)
+        btc_90d = ohlcv_store.pct_return(90)
         spx_90d = extract_90d_return(spx_r)
 
         if btc_90d is not None and spx_90d is not None:
@@ -223,54 +152,17 @@ def get_spx_comparison():
 
 def get_gli(fred_key: str):
     """
-    Compute Global Liquidity Index (GLI) from FRED API.
+    Compute Global Liquidity Index (GLI) from FRED data.
     Uses Fed (WALCL), ECB (ECBASSETSW), and BoJ (JPNASSETS) balance sheets,
-    converted to USD trillions using live FX rates from FRED.
+    converted to USD trillions using FRED FX rates. Series are read from the
+    local mirror in fred_store, which only fetches new observations.
     Returns (gli_now_trillions, gli_12m_ago_trillions, yoy_pct_change, trend_label)
     """
     try:
-        base = 'https://api.stlouisfed.org/fred/series/observations'
-
-        def fred_get(series_id, limit=5, start=None):
-            params = {
-                'series_id': series_id,
-                'api_key': fred_key,
-                'file_type': 'json',
-                'sort_order': 'desc',
-                'limit': limit,
-            }
-            if start:
-                params['observation_start'] = start
-                params['sort_order'] = 'asc'
-                del params['limit']
-            r = requests.get(base, params=params, timeout=12)
-            obs = [o for o in r.json().get('observations', []) if o['value'] != '.']
-            return obs
-
-        # Latest FX rates
-        jpy_usd = float(fred_get('DEXJPUS')[0]['value'])   # JPY per 1 USD
-        eur_usd = float(fred_get('DEXUSEU')[0]['value'])   # USD per 1 EUR
-
-        # Latest CB balance sheets
-        fed_m  = float(fred_get('WALCL')[0]['value'])        # USD millions
-        ecb_m  = float(fred_get('ECBASSETSW')[0]['value'])   # EUR millions
-        boj_b  = float(fred_get('JPNASSETS')[0]['value'])    # JPY billions
-
-        fed_t = fed_m / 1_000_000
-        ecb_t = (ecb_m * eur_usd) / 1_000_000
-        boj_t = (boj_b * 1000 / jpy_usd) / 1_000_000
-        gli_now = fed_t + ecb_t + boj_t
-
-        # 12 months ago
-        start_12m = (datetime.now() - timedelta(days=400)).strftime('%Y-%m-%d')
-        fed_h  = fred_get('WALCL',     start=start_12m)
-        ecb_h  = fred_get('ECBASSETSW', start=start_12m)
-        boj_h  = fred_get('JPNASSETS', start=start_12m)
-
-        fed_t0 = float(fed_h[0]['value']) / 1_000_000 if fed_h else fed_t
-        ecb_t0 = (float(ecb_h[0]['value']) * eur_usd) / 1_000_000 if ecb_h else ecb_t
-        boj_t0 = (float(boj_h[0]['value']) * 1000 / jpy_usd) / 1_000_000 if boj_h else boj_t
-        gli_12m = fed_t0 + ecb_t0 + boj_t0
+        fred_store.sync_all(fred_key)
+        gli_now, gli_12m = fred_store.gli_now_and_year_ago()
+        if not (gli_now > 0 and gli_12m > 0):
+            raise ValueError("FRED mirror is missing observations")
 
         yoy = ((gli_now - gli_12m) / gli_12m * 100) if gli_12m > 0 else 0
 
@@ -288,19 +180,27 @@ def get_gli(fred_key: str):
         return 19.0, 21.0, -10.0, 'Contracting'  # fallback based on recent data
 
 
-def get_market_data():
-    """Returns market cap, volume, dominance, supply etc."""
+def get_coingecko_market():
+    """
+    Lean CoinGecko snapshot for BTC: one /coins/markets row (~1 KB) carrying
+    price, market cap, volume, supply, ATH and 24h/7d/30d/1y changes.
+    Fetched once per cycle and shared by get_market_data and the price fallback.
+    """
+    rows = _get("https://api.coingecko.com/api/v3/coins/markets", params={
+        'vs_currency': 'usd', 'ids': 'bitcoin', 'price_change_percentage': '24h,7d,30d,1y',
+    })
+    return rows[0] if isinstance(rows, list) and rows else {}
+
+
+def get_market_data(cg=None):
+    """Returns market cap, volume, dominance, supply etc.
+    `cg` is the cycle's get_coingecko_market() row; fetched here if not given."""
     result = {}
 
-    # Primary: Yahoo Finance quote summary
+    # Primary: Yahoo Finance chart meta from the canonical OHLCV store
     try:
-        from data_api import ApiClient
-        client = ApiClient()
-        r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': 'BTC-USD', 'interval': '1d', 'range': '5d',
-        })
-        if r and 'chart' in r and r['chart'].get('result'):
-            meta = r['chart']['result'][0]['meta']
+        meta = ohlcv_store.meta()
+        if meta:
             price = meta.get('regularMarketPrice', 67000)
             circulating = 19_900_000  # approximate
             mkt_cap = meta.get('marketCap', price * circulating)
@@ -319,19 +219,19 @@ def get_market_data():
 
     # Enrich / fallback with CoinGecko (more complete data)
     try:
-        cg = _get("https://api.coingecko.com/api/v3/coins/bitcoin?localization=false&tickers=false&community_data=false&developer_data=false", timeout=10)
+        if cg is None:
+            cg = get_coingecko_market()
         if cg:
-            md = cg.get('market_data', {})
-            cg_cap = md.get('market_cap', {}).get('usd', 0)
-            cg_vol = md.get('total_volume', {}).get('usd', 0)
+            cg_cap = cg.get('market_cap') or 0
+            cg_vol = cg.get('total_volume') or 0
             return {
                 'market_cap':   cg_cap if cg_cap else result.get('market_cap', 0),
                 'total_volume': cg_vol if cg_vol else result.get('total_volume', 0),
-                'circulating':  md.get('circulating_supply', 19_900_000),
-                'ath':          md.get('ath', {}).get('usd', 0),
-                'chg_7d':       md.get('price_change_percentage_7d', 0),
-                'chg_30d':      md.get('price_change_percentage_30d', 0),
-                'chg_1y':       md.get('price_change_percentage_1y', 0),
+                'circulating':  cg.get('circulating_supply') or 19_900_000,
+                'ath':          cg.get('ath') or 0,
+                'chg_7d':       cg.get('price_change_percentage_7d_in_currency') or 0,
+                'chg_30d':      cg.get('price_change_percentage_30d_in_currency') or 0,
+                'chg_1y':       cg.get('price_change_percentage_1y_in_currency') or 0,
             }
     except Exception as e:
         print(f"CoinGecko market data error: {e}")
@@ -383,29 +283,32 @@ def get_fear_greed():
 # 3. Computed Indicators from Price Data
 # ─────────────────────────────────────────────────────────────────────────────
 
-def compute_indicators(df_daily, df_weekly, price):
+def compute_indicators(df_daily, df_weekly, price, stream=None):
     """
     Compute all indicators that can be derived from price data alone.
+    Latest values are taken from the vectorized series in indicator_engine,
+    or from `stream` (indicator_stream.update() over the same store) when
+    given, which avoids recomputing the full histories.
     Returns a dict of {indicator_name: value}.
     """
+    if stream:
+        return _indicators_from_stream(stream, price)
     results = {}
 
+    def last(series, fallback):
+        v = float(series[-1]) if len(series) else np.nan
+        return fallback if np.isnan(v) else v
+
     if df_daily is not None and not df_daily.empty:
-        close = df_daily['close']
+        close = df_daily['close'].to_numpy(dtype='float64')
+        daily = indicator_engine.daily_indicators(close)
 
         # ── RSI (14-day) ──
-        delta = close.diff()
-        gain  = delta.clip(lower=0)
-        loss  = -delta.clip(upper=0)
-        avg_g = gain.ewm(com=13, adjust=False).mean()
-        avg_l = loss.ewm(com=13, adjust=False).mean()
-        rs    = avg_g / avg_l.replace(0, np.nan)
-        rsi   = 100 - (100 / (1 + rs))
-        results['rsi_14'] = float(rsi.iloc[-1]) if not rsi.isna().all() else 50.0
+        results['rsi_14'] = last(daily['rsi_14'], 50.0)
 
         # ── Moving Averages ──
-        results['ma_200d'] = float(close.rolling(200).mean().iloc[-1]) if len(close) >= 200 else float(close.mean())
-        results['ma_50d']  = float(close.rolling(50).mean().iloc[-1])  if len(close) >= 50  else float(close.mean())
+        results['ma_200d'] = last(daily['ma_200d'], float(close.mean()))
+        results['ma_50d']  = last(daily['ma_50d'],  float(close.mean()))
 
         # ── Mayer Multiple (price / 200-day MA) ──
         if results['ma_200d'] > 0:
@@ -413,29 +316,50 @@ def compute_indicators(df_daily, df_weekly, price):
         else:
             results['mayer_multiple'] = 1.0
 
+        # ── Pi Cycle: 111DMA vs 2×350DMA ──
+        if len(close) >= 350:
+            results['pi_ratio']     = last(daily['pi_ratio'], 0.5)
+            results['pi_triggered'] = bool(daily['pi_triggered'][-1])
+
     if not df_weekly.empty:
-        wclose = df_weekly['close']
+        wclose = df_weekly['close'].to_numpy(dtype='float64')
+        weekly = indicator_engine.weekly_indicators(wclose)
 
         # ── 200-Week MA ──
-        results['ma_200w'] = float(wclose.rolling(200).mean().iloc[-1]) if len(wclose) >= 200 else float(wclose.mean())
+        results['ma_200w'] = last(weekly['ma_200w'], float(wclose.mean()))
 
         # ── Weekly RSI ──
-        wdelta = wclose.diff()
-        wgain  = wdelta.clip(lower=0)
-        wloss  = -wdelta.clip(upper=0)
-        wavg_g = wgain.ewm(com=13, adjust=False).mean()
-        wavg_l = wloss.ewm(com=13, adjust=False).mean()
-        wrs    = wavg_g / wavg_l.replace(0, np.nan)
-        wrsi   = 100 - (100 / (1 + wrs))
-        results['rsi_weekly'] = float(wrsi.iloc[-1]) if not wrsi.isna().all() else 50.0
+        results['rsi_weekly'] = last(weekly['rsi_weekly'], 50.0)
 
         # ── 2-Year MA Multiplier (price vs 2yr MA) ──
-        results['ma_2yr'] = float(wclose.rolling(104).mean().iloc[-1]) if len(wclose) >= 104 else float(wclose.mean())
+        results['ma_2yr'] = last(weekly['ma_2yr'], float(wclose.mean()))
         results['ma_2yr_x5'] = results['ma_2yr'] * 5  # sell signal when price > 5x 2yr MA
 
     return results
 
 
+def _indicators_from_stream(v, price):
+    """compute_indicators() result from streaming indicator values."""
+    def get(key, fallback):
+        x = v.get(key, np.nan)
+        return fallback if x is None or np.isnan(x) else float(x)
+
+    results = {
+        'rsi_14':  get('rsi_14', 50.0),
+        'ma_200d': get('ma_200d', v['close']),
+        'ma_50d':  get('ma_50d', v['close']),
+    }
+    results['mayer_multiple'] = price / results['ma_200d'] if results['ma_200d'] > 0 else 1.0
+    if not np.isnan(v.get('pi_ratio', np.nan)):
+        results['pi_ratio']     = float(v['pi_ratio'])
+        results['pi_triggered'] = bool(v['pi_triggered'])
+    results['ma_200w']    = get('ma_200w', v['close'])
+    results['rsi_weekly'] = get('rsi_weekly', 50.0)
+    results['ma_2yr']     = get('ma_2yr', v['close'])
+    results['ma_2yr_x5']  = results['ma_2yr'] * 5
+    return results
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 4. Lookaside: Scrape CoinGlass for live on-chain indicator values
 # ─────────────────────────────────────────────────────────────────────────────
@@ -458,7 +382,7 @@ def get_coinglass_indicators():
 
     for key, url in endpoints.items():
         try:
-            d = _get(url, timeout=8)
+            d = _get(url)
             if d and 'data' in d and d['data']:
                 latest = d['data'][-1] if isinstance(d['data'], list) else d['data']
                 val = latest.get('value', latest.get('v', None))
@@ -470,7 +394,7 @@ def get_coinglass_indicators():
     return indicators
 
 
-def get_lookaside_indicators(price):
+def get_lookaside_indicators():
     """
     Fetch on-chain indicators from multiple free sources.
     Uses CoinGecko derivatives + computed approximations.
@@ -484,7 +408,7 @@ def get_lookaside_indicators(price):
 
     # ── CBBI (Crypto Bitcoin Bull Run Index) ──
     try:
-        d = _get("https://colintalkscrypto.com/cbbi/data/latest.json", timeout=10)
+        d = _get("https://colintalkscrypto.com/cbbi/data/latest.json")
         if d and 'Confidence' in d:
             indicators['cbbi'] = float(d['Confidence']) * 100
     except Exception as e:
@@ -492,7 +416,7 @@ def get_lookaside_indicators(price):
 
     # ── Altcoin Season Index ──
     try:
-        d = _get("https://api.alternative.me/v2/altcoin-season-index/", timeout=8)
+        d = _get("https://api.alternative.me/v2/altcoin-season-index/")
         if d and 'data' in d:
             indicators['altcoin_season'] = int(d['data'].get('value', 50))
     except Exception as e:
@@ -525,39 +449,85 @@ def get_halving_info():
 # 6. Master Indicator Aggregator
 # ─────────────────────────────────────────────────────────────────────────────
 
+FETCH_WORKERS = 12  # upper bound on concurrent upstream fetches per refresh
+
+
+def _run_fetch_graph(jobs):
+    """
+    Run independent fetchers concurrently in a thread pool.
+    jobs: {name: (fn, deps)} — fn is called with the results of the jobs named
+    in `deps` as positional args, so a job only waits on what it needs.
+    Returns {name: result}. Wall time ≈ the slowest dependency chain.
+    Each job is recorded as a metrics span under its name.
+    """
+    futures = {}
+    with ThreadPoolExecutor(max_workers=min(len(jobs), FETCH_WORKERS),
+                            thread_name_prefix='fetch') as pool:
+        def _submit(name):
+            if name in futures:
+                return futures[name]
+            fn, deps = jobs[name]
+            dep_futures = [_submit(d) for d in deps]
+            def run():
+                args = [f.result() for f in dep_futures]
+                with metrics.span(name):
+                    return fn(*args)
+            futures[name] = pool.submit(run)
+            return futures[name]
+
+        for name in jobs:
+            _submit(name)
+        return {name: f.result() for name, f in futures.items()}
+
+
 def get_all_indicators():
     """
     Fetch and compute all indicators. Returns a structured dict.
+    All upstream sources are fetched concurrently, then joined before
+    compute_indicators().
     """
-    print("Fetching price data...")
-    df_daily, price, chg_24h, meta = get_btc_price_and_market()
-    df_weekly = get_btc_ohlcv_weekly()
-    market    = get_market_data()
-    global_d  = get_global_data()
-
-    print("Fetching DXY...")
-    dxy_value, dxy_chg = get_dxy()
-
-    print("Fetching BTC vs SPX...")
-    btc_90d, spx_90d, spx_divergence = get_spx_comparison()
-    price_aud_live, chg_24h_aud, chg_7d_aud = get_btc_aud_changes()
-    print("Fetching GLI from FRED...")
-    import os
     fred_key = os.environ.get('FRED_API_KEY', '0d9475394ac10c664def19fabafb6ffa')
-    gli_now, gli_12m, gli_yoy, gli_trend = get_gli(fred_key)
+
+    print("Fetching all sources concurrently...")
+    t0 = time.time()
+    fetched = _run_fetch_graph({
+        'price':     (get_btc_price_and_market, ()),
+        'weekly':    (get_btc_ohlcv_weekly, ()),
+        'cg_market': (get_coingecko_market, ()),
+        'market':    (get_market_data, ('cg_market',)),
+        'global':    (get_global_data, ()),
+        'dxy':       (get_dxy, ()),
+        'spx':       (get_spx_comparison, ()),
+        'aud':       (get_btc_aud_changes, ()),
+        'gli':       (lambda: get_gli(fred_key), ()),
+        'fg':        (get_fear_greed, ()),
+        'onchain':   (get_coinglass_indicators, ()),
+        'lookaside': (get_lookaside_indicators, ()),
+    })
+    print(f"Fetched all sources in {time.time() - t0:.1f}s")
+
+    df_daily, price, chg_24h, meta = fetched['price']
+    df_weekly = fetched['weekly']
+    market    = fetched['market']
+    global_d  = fetched['global']
+    dxy_value, dxy_chg = fetched['dxy']
+    btc_90d, spx_90d, spx_divergence = fetched['spx']
+    price_aud_live, chg_24h_aud, chg_7d_aud = fetched['aud']
+    gli_now, gli_12m, gli_yoy, gli_trend = fetched['gli']
+    fg_value, fg_label, fg_history = fetched['fg']
+    onchain   = fetched['onchain']
+    lookaside = fetched['lookaside']
 
     if price is None or price == 0:
         price = 67000
 
     print("Computing technical indicators...")
-    tech = compute_indicators(df_daily, df_weekly, price)
-
-    print("Fetching Fear & Greed...")
-    fg_value, fg_label, fg_history = get_fear_greed()
-
-    print("Fetching on-chain indicators...")
-    onchain   = get_coinglass_indicators()
-    lookaside = get_lookaside_indicators(price)
+    try:
+        stream = indicator_stream.update() if df_daily is not None else None
+    except Exception as e:
+        print(f"Indicator stream error, using batch path: {e}")
+        stream = None
+    tech = compute_indicators(df_daily, df_weekly, price, stream=stream)
 
     # ── Assemble all indicator values ──
     # Use fetched values where available, otherwise use computed approximations
@@ -580,15 +550,8 @@ def get_all_indicators():
     altcoin_season = lookaside.get('altcoin_season', 43)
 
     # ── Pi Cycle: 111DMA vs 2×350DMA ──
-    pi_triggered = False
-    if df_daily is not None and len(df_daily) >= 350:
-        close = df_daily['close']
-        ma111 = close.rolling(111).mean().iloc[-1]
-        ma350x2 = close.rolling(350).mean().iloc[-1] * 2
-        pi_triggered = bool(ma111 >= ma350x2)
-        pi_ratio = float(ma111 / ma350x2) if ma350x2 > 0 else 0.5
-    else:
-        pi_ratio = 0.34  # from CoinGlass data
+    pi_triggered = tech.get('pi_triggered', False)
+    pi_ratio     = tech.get('pi_ratio', 0.34)  # default from CoinGlass data
 
     # ── 200W MA heatmap position ──
     pct_above_200w = ((price - ma_200w) / ma_200w * 100) if ma_200w > 0 else 50
@@ -672,6 +635,19 @@ def get_all_indicators():
 # 7. Signal Logic
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Integer zone codes used by the array path (backtests, sweeps)
+ZONE_BUY, ZONE_CAUTION, ZONE_SELL, ZONE_MISSING = 0, 1, 2, -1
+ZONE_STYLES = {
+    ZONE_BUY:     ('BUY', '#00C853', '🟢'),
+    ZONE_CAUTION: ('CAUTION', '#FFC107', '🟡'),
+    ZONE_SELL:    ('SELL', '#FF3D57', '🔴'),
+}
+ZONE_CODES = {style[0]: code for code, style in ZONE_STYLES.items()}
+
+SIGNAL_KEYS = ('name', 'category', 'value', 'value_str', 'signal', 'color', 'emoji',
+               'description', 'buy_zone', 'sell_zone', 'detail')
+
+
 def classify_signal(value, buy_max, caution_max, sell_min=None, invert=False):
     """
     Returns ('BUY'|'CAUTION'|'SELL', color_hex, emoji)
@@ -679,260 +655,441 @@ def classify_signal(value, buy_max, caution_max, sell_min=None, invert=False):
     """
     if invert:
         if value >= buy_max:
-            return 'BUY', '#00C853', '🟢'
+            return ZONE_STYLES[ZONE_BUY]
         elif value >= caution_max:
-            return 'CAUTION', '#FFC107', '🟡'
+            return ZONE_STYLES[ZONE_CAUTION]
         else:
-            return 'SELL', '#FF3D57', '🔴'
+            return ZONE_STYLES[ZONE_SELL]
     else:
         if value <= buy_max:
-            return 'BUY', '#00C853', '🟢'
+            return ZONE_STYLES[ZONE_BUY]
         elif value <= caution_max:
-            return 'CAUTION', '#FFC107', '🟡'
+            return ZONE_STYLES[ZONE_CAUTION]
         else:
-            return 'SELL', '#FF3D57', '🔴'
+            return ZONE_STYLES[ZONE_SELL]
 
 
-def get_all_signals(data):
+def classify_signal_array(values, buy_max, caution_max, invert=False, nan_zone=ZONE_SELL):
+    """
+    Vectorized classify_signal returning int8 zone codes (ZONE_BUY/CAUTION/SELL).
+    values and thresholds broadcast against each other, so a (k, 1) column of
+    thresholds against (n,) values classifies k threshold sets at once.
+    NaN values land in `nan_zone` — SELL by default, exactly like the scalar
+    comparisons; pass ZONE_MISSING to mark them instead.
+    """
+    v = np.asarray(values, dtype='float64')
+    buy_max = np.asarray(buy_max, dtype='float64')
+    caution_max = np.asarray(caution_max, dtype='float64')
+    if invert:
+        conds = [v >= buy_max, v >= caution_max]
+    else:
+        conds = [v <= buy_max, v <= caution_max]
+    zones = np.select(conds, [ZONE_BUY, ZONE_CAUTION], default=ZONE_SELL).astype('int8')
+    if nan_zone != ZONE_SELL:
+        zones = np.where(np.isnan(v), nan_zone, zones).astype('int8')
+    return zones
+
+
+def gli_zone(yoy):
+    """GLI YoY % → zone code(s): expanding → BUY, flat → CAUTION, contracting < -5% → SELL."""
+    v = np.asarray(yoy, dtype='float64')
+    return np.select([v > 0, v > -5], [ZONE_BUY, ZONE_CAUTION], default=ZONE_SELL).astype('int8')
+
+
+def pi_cycle_zone(pi_ratio, pi_triggered):
+    """Pi Cycle → zone code(s): triggered → SELL, ratio above PI_CAUTION → CAUTION, else BUY."""
+    r = np.asarray(pi_ratio, dtype='float64')
+    trig = np.asarray(pi_triggered, dtype='float64') == 1
+    return np.select([trig, r > indicator_engine.PI_CAUTION], [ZONE_SELL, ZONE_CAUTION],
+                     default=ZONE_BUY).astype('int8')
+
+
+def dxy_zone(dxy, dxy_chg):
+    """Weak or falling dollar → BUY, strong or rising → SELL, else CAUTION."""
+    if dxy < 100 or dxy_chg < -0.5:
+        return ZONE_BUY
+    if dxy > 106 or dxy_chg > 0.5:
+        return ZONE_SELL
+    return ZONE_CAUTION
+
+
+def spx_zone(spx_div):
+    """BTC lagging SPX by 20%+ → BUY (mean reversion), leading by 20%+ → SELL (late cycle)."""
+    if spx_div <= -20:
+        return ZONE_BUY
+    if spx_div >= 20:
+        return ZONE_SELL
+    return ZONE_CAUTION
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Signal registry
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SignalSpec:
+    """
+    One dashboard signal. The static text is fixed at import; evaluate() only
+    computes what changes per cycle (value, value_str, zone, detail).
+
+    value(data)              → the classified value
+    fmt(value, data)         → value_str
+    detail(value, data)      → detail line
+    thresholds               → classify_signal() kwargs, or None when `zone` is custom
+    zone(value, data)        → zone code for signals without thresholds
+    history                  → column in backtest.load_inputs() holding this signal's
+                               history (None if it has none)
+    history_zone(frame)      → zone codes over that frame for custom-zone signals
+    """
+
+    def __init__(self, name, category, description, buy_zone, sell_zone, value, fmt, detail,
+                 thresholds=None, zone=None, history=None, history_zone=None):
+        self.name = name
+        self.category = category
+        self.description = description
+        self.buy_zone = buy_zone
+        self.sell_zone = sell_zone
+        self.value = value
+        self.fmt = fmt
+        self.detail = detail
+        self.thresholds = thresholds
+        self.zone = zone
+        self.history = history
+        self.history_zone = history_zone
+
+    def zone_of(self, value, data):
+        if self.thresholds is not None:
+            return ZONE_CODES[classify_signal(value, **self.thresholds)[0]]
+        return int(self.zone(value, data))
+
+    def evaluate(self, data):
+        value = self.value(data)
+        return Signal(self, value, self.fmt(value, data), self.zone_of(value, data), self.detail(value, data))
+
+    def zones(self, frame, thresholds=None):
+        """
+        Zone codes over a history frame (backtest.load_inputs() layout), ZONE_MISSING
+        where the value is NaN. `thresholds` overrides this signal's cutoffs.
+        """
+        values = frame[self.history].to_numpy(dtype='float64')
+        if self.history_zone is not None:
+            z = self.history_zone(frame)
+        else:
+            z = classify_signal_array(values, **(thresholds or self.thresholds))
+        return np.where(np.isnan(values), ZONE_MISSING, z).astype('int8')
+
+
+class Signal:
     """
-    Returns a list of indicator signal dicts for display.
-    Each dict: {name, category, value, value_str, signal, color, emoji, description, buy_zone, sell_zone}
+    One evaluated signal: the per-cycle fields plus a reference to its SignalSpec.
+    Read-only, and reads like the old signal dict (s['name'], s.get('detail', ''),
+    keys(), dict(s)), so existing callers are unchanged. Static text lives on the
+    shared spec; pickling stores only the spec name and the per-cycle fields.
     """
-    p = data['price']
-    signals = []
-
-    def add(name, category, value, value_str, signal_tuple, description, buy_zone, sell_zone, detail=''):
-        sig, color, emoji = signal_tuple
-        signals.append({
-            'name':        name,
-            'category':    category,
-            'value':       value,
-            'value_str':   value_str,
-            'signal':      sig,
-            'color':       color,
-            'emoji':       emoji,
-            'description': description,
-            'buy_zone':    buy_zone,
-            'sell_zone':   sell_zone,
-            'detail':      detail,
-        })
 
+    __slots__ = ('spec', 'value', 'value_str', 'zone', 'detail')
+
+    def __init__(self, spec, value, value_str, zone, detail):
+        _set = object.__setattr__
+        _set(self, 'spec', spec)
+        _set(self, 'value', value)
+        _set(self, 'value_str', value_str)
+        _set(self, 'zone', zone)
+        _set(self, 'detail', detail)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Signal records are read-only")
+
+    def __reduce__(self):
+        return _signal_record, (self.spec.name, self.value, self.value_str, self.zone, self.detail)
+
+    def __getitem__(self, key):
+        if key in ('value', 'value_str', 'detail'):
+            return getattr(self, key)
+        if key == 'signal':
+            return ZONE_STYLES[self.zone][0]
+        if key == 'color':
+            return ZONE_STYLES[self.zone][1]
+        if key == 'emoji':
+            return ZONE_STYLES[self.zone][2]
+        if key in ('name', 'category', 'description', 'buy_zone', 'sell_zone'):
+            return getattr(self.spec, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in SIGNAL_KEYS
+
+    def __iter__(self):
+        return iter(SIGNAL_KEYS)
+
+    def __len__(self):
+        return len(SIGNAL_KEYS)
+
+    def keys(self):
+        return SIGNAL_KEYS
+
+    def items(self):
+        return [(k, self[k]) for k in SIGNAL_KEYS]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, Signal):
+            return self.spec is other.spec and self.__reduce__() == other.__reduce__()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Signal({self.spec.name!r}, {self['signal']}, {self.value_str!r})"
+
+
+def _signal_record(name, value, value_str, zone, detail):
+    """Unpickle a Signal against this process's registry entry."""
+    return Signal(SIGNAL_SPECS[name], value, value_str, zone, detail)
+
+
+def _nupl_pct(data):
+    return data['nupl'] * 100 if data['nupl'] < 1 else data['nupl']
+
+
+def _gli_detail(gli_yoy, data):
+    gli_now = data.get('gli_now', 19.0)
+    if gli_yoy > 5:
+        return f"GLI expanding +{gli_yoy:.1f}% YoY (${gli_now:.1f}T) — central banks are injecting liquidity. Historically a strong tailwind for Bitcoin."
+    if gli_yoy > 0:
+        return f"GLI growing +{gli_yoy:.1f}% YoY (${gli_now:.1f}T) — modest expansion in global liquidity. Mildly supportive for risk assets."
+    if gli_yoy > -5:
+        return f"GLI flat/slightly contracting {gli_yoy:.1f}% YoY (${gli_now:.1f}T) — liquidity is tightening. Bitcoin may face headwinds until this reverses."
+    return f"GLI contracting {gli_yoy:.1f}% YoY (${gli_now:.1f}T) — significant liquidity withdrawal. This is the macro headwind Crypto Currently has been warning about."
+
+
+def _dxy_detail(dxy, data):
+    zone = dxy_zone(dxy, data.get('dxy_chg', 0.0))
+    if zone == ZONE_BUY:
+        return f"DXY at {dxy:.1f} — weak/falling dollar is a tailwind for Bitcoin and risk assets."
+    if zone == ZONE_SELL:
+        return f"DXY at {dxy:.1f} — strong/rising dollar tightens global liquidity and pressures Bitcoin."
+    return f"DXY at {dxy:.1f} — dollar consolidating. Watch for breakout direction as it will drive liquidity."
+
+
+def _spx_detail(spx_div, data):
+    btc_90d = data.get('btc_90d', -28.0)
+    spx_90d = data.get('spx_90d', 5.0)
+    head = f"BTC {btc_90d:+.1f}% vs S&P 500 {spx_90d:+.1f}% over 90 days — "
+    if spx_div <= -20:
+        return (head + f"BTC is underperforming equities by {abs(spx_div):.0f}%. "
+                f"Historically (2018, 2022) these divergences have preceded strong BTC mean-reversion rallies.")
+    if spx_div >= 20:
+        return (head + f"BTC is outperforming equities by {spx_div:.0f}%. "
+                f"BTC leading equities to the upside is a late-cycle signal — historically precedes a top.")
+    return head + "BTC and equities are broadly correlated. No strong divergence signal."
+
+
+SIGNAL_REGISTRY = [
     # ── SENTIMENT ──
-    fg = data['fear_greed']
-    add('Fear & Greed Index', 'Sentiment',
-        fg, str(fg),
-        classify_signal(fg, 25, 55),
+    SignalSpec(
+        'Fear & Greed Index', 'Sentiment',
         'Market sentiment gauge. Extreme Fear = buying opportunity; Extreme Greed = caution.',
         '< 25 (Extreme Fear)', '> 75 (Extreme Greed)',
-        data['fear_greed_label'])
+        value=lambda d: d['fear_greed'],
+        fmt=lambda v, d: str(v),
+        detail=lambda v, d: d['fear_greed_label'],
+        thresholds={'buy_max': 25, 'caution_max': 55},
+        history='fear_greed'),
 
     # ── ON-CHAIN ──
-    mvrv = data['mvrv_zscore']
-    add('MVRV Z-Score', 'On-Chain',
-        mvrv, f"{mvrv:.2f}",
-        classify_signal(mvrv, 0, 3),
+    SignalSpec(
+        'MVRV Z-Score', 'On-Chain',
         'Measures if BTC is over/undervalued vs. realized value. Below 0 = historically great buy zone.',
         '< 0 (Undervalued)', '> 5 (Overvalued)',
-        f"{'🔥 Deep value zone' if mvrv < 0 else ('Fair value' if mvrv < 2 else 'Elevated')}")
-
-    nupl_pct = data['nupl'] * 100 if data['nupl'] < 1 else data['nupl']
-    add('NUPL (Net Unrealized P&L)', 'On-Chain',
-        nupl_pct, f"{nupl_pct:.1f}%",
-        classify_signal(nupl_pct, 25, 50),
+        value=lambda d: d['mvrv_zscore'],
+        fmt=lambda v, d: f"{v:.2f}",
+        detail=lambda v, d: '🔥 Deep value zone' if v < 0 else ('Fair value' if v < 2 else 'Elevated'),
+        thresholds={'buy_max': 0, 'caution_max': 3}),
+    SignalSpec(
+        'NUPL (Net Unrealized P&L)', 'On-Chain',
         'Ratio of unrealized profit vs loss. Capitulation zone (<0) = extreme buy; Euphoria (>75%) = sell.',
         '< 25% (Fear/Capitulation)', '> 75% (Euphoria)',
-        f"{'Capitulation' if nupl_pct < 0 else ('Fear' if nupl_pct < 25 else ('Hope' if nupl_pct < 50 else ('Optimism' if nupl_pct < 75 else 'Euphoria')))}")
-
-    puell = data['puell_multiple']
-    add('Puell Multiple', 'On-Chain',
-        puell, f"{puell:.2f}",
-        classify_signal(puell, 0.5, 2.2),
+        value=_nupl_pct,
+        fmt=lambda v, d: f"{v:.1f}%",
+        detail=lambda v, d: ('Capitulation' if v < 0 else ('Fear' if v < 25 else
+                             ('Hope' if v < 50 else ('Optimism' if v < 75 else 'Euphoria')))),
+        thresholds={'buy_max': 25, 'caution_max': 50}),
+    SignalSpec(
+        'Puell Multiple', 'On-Chain',
         'Miner revenue vs 365-day average. Low = miner capitulation = buy signal.',
         '< 0.5 (Miner Capitulation)', '> 2.2 (Miner Overprofit)',
-        f"{'Miner capitulation zone' if puell < 0.5 else ('Normal range' if puell < 2 else 'Elevated miner revenue')}")
-
-    rhodl = data['rhodl_ratio']
-    add('RHODL Ratio', 'On-Chain',
-        rhodl, f"{rhodl:,.0f}",
-        classify_signal(rhodl, 5000, 50000),
+        value=lambda d: d['puell_multiple'],
+        fmt=lambda v, d: f"{v:.2f}",
+        detail=lambda v, d: 'Miner capitulation zone' if v < 0.5 else ('Normal range' if v < 2 else 'Elevated miner revenue'),
+        thresholds={'buy_max': 0.5, 'caution_max': 2.2}),
+    SignalSpec(
+        'RHODL Ratio', 'On-Chain',
         'Ratio of 1-week vs 1-2yr realized HODL bands. Low = LTH dominance = accumulation phase.',
         '< 5,000 (LTH Dominant)', '> 50,000 (STH Dominant, Cycle Top)',
-        f"{'Early cycle / accumulation' if rhodl < 5000 else ('Mid cycle' if rhodl < 20000 else 'Late cycle')}")
-
-    rr = data['reserve_risk']
-    add('Reserve Risk', 'On-Chain',
-        rr, f"{rr:.4f}",
-        classify_signal(rr, 0.0012, 0.005),
+        value=lambda d: d['rhodl_ratio'],
+        fmt=lambda v, d: f"{v:,.0f}",
+        detail=lambda v, d: 'Early cycle / accumulation' if v < 5000 else ('Mid cycle' if v < 20000 else 'Late cycle'),
+        thresholds={'buy_max': 5000, 'caution_max': 50000}),
+    SignalSpec(
+        'Reserve Risk', 'On-Chain',
         'Risk/reward of investing relative to HODLer conviction. Low = high confidence buy.',
         '< 0.0012 (Low Risk)', '> 0.005 (High Risk)',
-        f"{'Excellent risk/reward' if rr < 0.0012 else ('Moderate' if rr < 0.005 else 'Elevated risk')}")
+        value=lambda d: d['reserve_risk'],
+        fmt=lambda v, d: f"{v:.4f}",
+        detail=lambda v, d: 'Excellent risk/reward' if v < 0.0012 else ('Moderate' if v < 0.005 else 'Elevated risk'),
+        thresholds={'buy_max': 0.0012, 'caution_max': 0.005}),
 
     # ── PRICE-BASED ──
-    mayer = data['mayer_multiple']
-    add('Mayer Multiple', 'Price Model',
-        mayer, f"{mayer:.2f}x",
-        classify_signal(mayer, 0.8, 1.5),
+    SignalSpec(
+        'Mayer Multiple', 'Price Model',
         'Price divided by 200-day MA. Below 0.8 = historically excellent accumulation zone.',
         '< 0.8 (Deep Discount)', '> 2.4 (Overextended)',
-        f"{'Extreme discount' if mayer < 0.8 else ('Below average' if mayer < 1.0 else ('Fair' if mayer < 1.5 else 'Premium'))}")
-
-    ma200w = data['ma_200w']
-    pct_200w = data['pct_above_200w']
-    add('200-Week MA Heatmap', 'Price Model',
-        pct_200w, f"{pct_200w:+.1f}% vs ${ma200w:,.0f}",
-        classify_signal(pct_200w, 0, 100),
+        value=lambda d: d['mayer_multiple'],
+        fmt=lambda v, d: f"{v:.2f}x",
+        detail=lambda v, d: ('Extreme discount' if v < 0.8 else
+                             ('Below average' if v < 1.0 else ('Fair' if v < 1.5 else 'Premium'))),
+        thresholds={'buy_max': 0.8, 'caution_max': 1.5},
+        history='mayer'),
+    SignalSpec(
+        '200-Week MA Heatmap', 'Price Model',
         'Price vs 200-week moving average. Every bear market bottom has touched or gone below this level.',
         'Below 200W MA (< 0%)', '> 100% above 200W MA',
-        f"{'Below 200W MA — historic buy zone' if pct_200w < 0 else (f'{pct_200w:.0f}% above 200W MA')}")
-
-    ma2yr = data['ma_2yr_ratio']
-    add('2-Year MA Multiplier', 'Price Model',
-        ma2yr, f"{ma2yr:.2f}x",
-        classify_signal(ma2yr, 0.8, 2.0),
+        value=lambda d: d['pct_above_200w'],
+        fmt=lambda v, d: f"{v:+.1f}% vs ${d['ma_200w']:,.0f}",
+        detail=lambda v, d: 'Below 200W MA — historic buy zone' if v < 0 else f'{v:.0f}% above 200W MA',
+        thresholds={'buy_max': 0, 'caution_max': 100},
+        history='pct_above_200w'),
+    SignalSpec(
+        '2-Year MA Multiplier', 'Price Model',
         'Price vs 2-year moving average. Below 1x = accumulation; above 5x = cycle top.',
         '< 1.0x (Below 2YR MA)', '> 3.5x (Cycle Top Zone)',
-        f"{'Below 2yr MA' if ma2yr < 1.0 else (f'{ma2yr:.2f}x above 2yr MA')}")
-
-    ahr = data['ahr999']
-    add('Ahr999 Index', 'Price Model',
-        ahr, f"{ahr:.2f}",
-        classify_signal(ahr, 0.45, 1.2),
+        value=lambda d: d['ma_2yr_ratio'],
+        fmt=lambda v, d: f"{v:.2f}x",
+        detail=lambda v, d: 'Below 2yr MA' if v < 1.0 else f'{v:.2f}x above 2yr MA',
+        thresholds={'buy_max': 0.8, 'caution_max': 2.0},
+        history='ma_2yr_ratio'),
+    SignalSpec(
+        'Ahr999 Index', 'Price Model',
         'Combines price growth model with mining cost. Below 0.45 = DCA zone; below 1.2 = buy zone.',
         '< 0.45 (DCA Zone)', '> 4.0 (Sell Zone)',
-        f"{'DCA zone' if ahr < 0.45 else ('Buy zone' if ahr < 1.2 else ('Hold' if ahr < 4.0 else 'Sell zone'))}")
+        value=lambda d: d['ahr999'],
+        fmt=lambda v, d: f"{v:.2f}",
+        detail=lambda v, d: ('DCA zone' if v < 0.45 else
+                             ('Buy zone' if v < 1.2 else ('Hold' if v < 4.0 else 'Sell zone'))),
+        thresholds={'buy_max': 0.45, 'caution_max': 1.2},
+        history='ahr999'),
 
     # ── TECHNICAL ──
-    rsi = data['rsi_14']
-    add('RSI (14-Day)', 'Technical',
-        rsi, f"{rsi:.1f}",
-        classify_signal(rsi, 30, 70),
+    SignalSpec(
+        'RSI (14-Day)', 'Technical',
         'Relative Strength Index. Below 30 = oversold (buy); above 70 = overbought (caution).',
         '< 30 (Oversold)', '> 70 (Overbought)',
-        f"{'Oversold' if rsi < 30 else ('Neutral' if rsi < 70 else 'Overbought')}")
-
-    rsi_w = data['rsi_weekly']
-    add('RSI Weekly', 'Technical',
-        rsi_w, f"{rsi_w:.1f}",
-        classify_signal(rsi_w, 35, 65),
+        value=lambda d: d['rsi_14'],
+        fmt=lambda v, d: f"{v:.1f}",
+        detail=lambda v, d: 'Oversold' if v < 30 else ('Neutral' if v < 70 else 'Overbought'),
+        thresholds={'buy_max': 30, 'caution_max': 70},
+        history='rsi_14'),
+    SignalSpec(
+        'RSI Weekly', 'Technical',
         'Weekly RSI gives a longer-term momentum view. Below 35 = major accumulation signal.',
         '< 35 (Oversold Weekly)', '> 80 (Overbought Weekly)',
-        f"{'Oversold — strong buy signal' if rsi_w < 35 else ('Neutral' if rsi_w < 65 else 'Overbought')}")
-
-    pi = data['pi_ratio']
-    pi_sig = ('SELL', '#FF3D57', '🔴') if data['pi_triggered'] else \
-             ('CAUTION', '#FFC107', '🟡') if pi > 0.85 else \
-             ('BUY', '#00C853', '🟢')
-    add('Pi Cycle Top', 'Technical',
-        pi, f"{'⚠️ TRIGGERED' if data['pi_triggered'] else f'{pi:.2f} ratio'}",
-        pi_sig,
+        value=lambda d: d['rsi_weekly'],
+        fmt=lambda v, d: f"{v:.1f}",
+        detail=lambda v, d: 'Oversold — strong buy signal' if v < 35 else ('Neutral' if v < 65 else 'Overbought'),
+        thresholds={'buy_max': 35, 'caution_max': 65},
+        history='rsi_weekly'),
+    SignalSpec(
+        'Pi Cycle Top', 'Technical',
         '111DMA crossing above 2×350DMA signals cycle top within days. Not triggered = safe.',
         'Not triggered (< 0.85)', 'Triggered (111DMA ≥ 2×350DMA)',
-        f"{'🚨 CYCLE TOP SIGNAL ACTIVE' if data['pi_triggered'] else ('Approaching trigger' if pi > 0.85 else 'Not triggered — safe')}")
+        value=lambda d: d['pi_ratio'],
+        fmt=lambda v, d: '⚠️ TRIGGERED' if d['pi_triggered'] else f'{v:.2f} ratio',
+        detail=lambda v, d: ('🚨 CYCLE TOP SIGNAL ACTIVE' if d['pi_triggered'] else
+                             ('Approaching trigger' if v > indicator_engine.PI_CAUTION else 'Not triggered — safe')),
+        zone=lambda v, d: pi_cycle_zone(v, bool(d['pi_triggered'])),
+        history='pi_ratio',
+        history_zone=lambda f: pi_cycle_zone(f['pi_ratio'], f['pi_triggered'])),
 
     # ── MARKET STRUCTURE ──
-    dom = data['btc_dominance']
-    add('BTC Dominance', 'Market Structure',
-        dom, f"{dom:.1f}%",
-        classify_signal(dom, 60, 45, invert=True),
+    SignalSpec(
+        'BTC Dominance', 'Market Structure',
         'BTC market share. High dominance = BTC leading, altcoin season not started = safer to accumulate BTC.',
         '> 60% (BTC Leading)', '< 45% (Altcoin Season, Cycle Top Near)',
-        f"{'BTC strongly dominant' if dom > 60 else ('Moderate dominance' if dom > 50 else 'Low dominance — altcoin season')}")
-
-    alt = data['altcoin_season']
-    add('Altcoin Season Index', 'Market Structure',
-        alt, f"{alt}/100",
-        classify_signal(alt, 25, 60),
+        value=lambda d: d['btc_dominance'],
+        fmt=lambda v, d: f"{v:.1f}%",
+        detail=lambda v, d: ('BTC strongly dominant' if v > 60 else
+                             ('Moderate dominance' if v > 50 else 'Low dominance — altcoin season')),
+        thresholds={'buy_max': 60, 'caution_max': 45, 'invert': True}),
+    SignalSpec(
+        'Altcoin Season Index', 'Market Structure',
         'Measures if altcoins are outperforming BTC. Low = Bitcoin season = good BTC accumulation time.',
         '< 25 (Bitcoin Season)', '> 75 (Altcoin Season)',
-        f"{'Bitcoin season' if alt < 25 else ('Mixed market' if alt < 75 else 'Altcoin season')}")
-
-    cbbi = data['cbbi']
-    add('CBBI (Bull Run Index)', 'Market Structure',
-        cbbi, f"{cbbi:.0f}/100",
-        classify_signal(cbbi, 30, 65),
+        value=lambda d: d['altcoin_season'],
+        fmt=lambda v, d: f"{v}/100",
+        detail=lambda v, d: 'Bitcoin season' if v < 25 else ('Mixed market' if v < 75 else 'Altcoin season'),
+        thresholds={'buy_max': 25, 'caution_max': 60}),
+    SignalSpec(
+        'CBBI (Bull Run Index)', 'Market Structure',
         '9-indicator composite of Bitcoin cycle position. 0 = cycle bottom; 100 = cycle top.',
         '< 30 (Early Cycle)', '> 90 (Cycle Top)',
-        f"{'Early cycle — accumulate' if cbbi < 30 else ('Mid cycle' if cbbi < 65 else ('Late cycle — caution' if cbbi < 90 else 'Cycle top'))}")
+        value=lambda d: d['cbbi'],
+        fmt=lambda v, d: f"{v:.0f}/100",
+        detail=lambda v, d: ('Early cycle — accumulate' if v < 30 else
+                             ('Mid cycle' if v < 65 else ('Late cycle — caution' if v < 90 else 'Cycle top'))),
+        thresholds={'buy_max': 30, 'caution_max': 65}),
 
     # ── MACRO ──
-    # GLI Signal
-    gli_yoy   = data.get('gli_yoy', -10.0)
-    gli_now   = data.get('gli_now', 19.0)
-    gli_trend = data.get('gli_trend', 'Contracting')
-
-    if gli_yoy > 5:
-        gli_sig = ('BUY', '#00C853', '🟢')
-        gli_detail = f"GLI expanding +{gli_yoy:.1f}% YoY (${gli_now:.1f}T) — central banks are injecting liquidity. Historically a strong tailwind for Bitcoin."
-    elif gli_yoy > 0:
-        gli_sig = ('BUY', '#00C853', '🟢')
-        gli_detail = f"GLI growing +{gli_yoy:.1f}% YoY (${gli_now:.1f}T) — modest expansion in global liquidity. Mildly supportive for risk assets."
-    elif gli_yoy > -5:
-        gli_sig = ('CAUTION', '#FFC107', '🟡')
-        gli_detail = f"GLI flat/slightly contracting {gli_yoy:.1f}% YoY (${gli_now:.1f}T) — liquidity is tightening. Bitcoin may face headwinds until this reverses."
-    else:
-        gli_sig = ('SELL', '#FF3D57', '🔴')
-        gli_detail = f"GLI contracting {gli_yoy:.1f}% YoY (${gli_now:.1f}T) — significant liquidity withdrawal. This is the macro headwind Crypto Currently has been warning about."
-
-    add('Global Liquidity Index (GLI)', 'Macro',
-        gli_yoy, f"{gli_now:.1f}T ({'+' if gli_yoy >= 0 else ''}{gli_yoy:.1f}% YoY)",
-        gli_sig,
+    SignalSpec(
+        'Global Liquidity Index (GLI)', 'Macro',
         'Composite of Fed, ECB, and BoJ central bank balance sheets converted to USD. When central banks expand their balance sheets (print money), global liquidity rises and Bitcoin historically surges. Contraction = headwind. This is the #1 macro indicator Crypto Currently tracks.',
         '> +5% YoY (Expanding — BTC Tailwind)', '< -5% YoY (Contracting — BTC Headwind)',
-        gli_detail)
-
-    dxy = data.get('dxy_value', 104.0)
-    dxy_chg = data.get('dxy_chg', 0.0)
-    # DXY signal: below 100 = weak dollar = BUY for BTC; 100-105 = neutral; above 105 = strong dollar = CAUTION
-    # Also factor in direction: falling DXY is bullish
-    if dxy < 100 or dxy_chg < -0.5:
-        dxy_sig = ('BUY', '#00C853', '🟢')
-        dxy_detail = f"DXY at {dxy:.1f} — weak/falling dollar is a tailwind for Bitcoin and risk assets."
-    elif dxy > 106 or dxy_chg > 0.5:
-        dxy_sig = ('SELL', '#FF3D57', '🔴')
-        dxy_detail = f"DXY at {dxy:.1f} — strong/rising dollar tightens global liquidity and pressures Bitcoin."
-    else:
-        dxy_sig = ('CAUTION', '#FFC107', '🟡')
-        dxy_detail = f"DXY at {dxy:.1f} — dollar consolidating. Watch for breakout direction as it will drive liquidity."
-
-    add('US Dollar Index (DXY)', 'Macro',
-        dxy, f"{dxy:.2f} ({'+' if dxy_chg >= 0 else ''}{dxy_chg:.2f}%)",
-        dxy_sig,
+        value=lambda d: d.get('gli_yoy', -10.0),
+        fmt=lambda v, d: f"{d.get('gli_now', 19.0):.1f}T ({'+' if v >= 0 else ''}{v:.1f}% YoY)",
+        detail=_gli_detail,
+        zone=lambda v, d: gli_zone(v),
+        history='gli_yoy',
+        history_zone=lambda f: gli_zone(f['gli_yoy'])),
+    SignalSpec(
+        'US Dollar Index (DXY)', 'Macro',
         'Measures USD strength against a basket of currencies. Falling DXY = looser global liquidity = bullish for BTC. Rising DXY = tighter liquidity = bearish. Crypto Currently monitors this closely as a key macro signal.',
         '< 100 (Weak Dollar — BTC Tailwind)', '> 106 (Strong Dollar — BTC Headwind)',
-        dxy_detail)
+        value=lambda d: d.get('dxy_value', 104.0),
+        fmt=lambda v, d: f"{v:.2f} ({'+' if d.get('dxy_chg', 0.0) >= 0 else ''}{d.get('dxy_chg', 0.0):.2f}%)",
+        detail=_dxy_detail,
+        zone=lambda v, d: dxy_zone(v, d.get('dxy_chg', 0.0))),
 
     # ── BTC vs S&P 500 Divergence ──
-    btc_90d      = data.get('btc_90d', -28.0)
-    spx_90d      = data.get('spx_90d', 5.0)
-    spx_div      = data.get('spx_divergence', -33.0)  # btc_90d - spx_90d
-
-    # Signal logic: based on Crypto Currently's divergence analysis
-    # BTC massively underperforming SPX = oversold vs equities = BUY (mean reversion)
-    # BTC massively outperforming SPX = late cycle / topping = SELL
-    if spx_div <= -20:
-        spx_sig = ('BUY', '#00C853', '\U0001f7e2')
-        spx_detail = (f"BTC {btc_90d:+.1f}% vs S&P 500 {spx_90d:+.1f}% over 90 days — "
-                      f"BTC is underperforming equities by {abs(spx_div):.0f}%. "
-                      f"Historically (2018, 2022) these divergences have preceded strong BTC mean-reversion rallies.")
-    elif spx_div >= 20:
-        spx_sig = ('SELL', '#FF3D57', '\U0001f534')
-        spx_detail = (f"BTC {btc_90d:+.1f}% vs S&P 500 {spx_90d:+.1f}% over 90 days — "
-                      f"BTC is outperforming equities by {spx_div:.0f}%. "
-                      f"BTC leading equities to the upside is a late-cycle signal — historically precedes a top.")
-    else:
-        spx_sig = ('CAUTION', '#FFC107', '\U0001f7e1')
-        spx_detail = (f"BTC {btc_90d:+.1f}% vs S&P 500 {spx_90d:+.1f}% over 90 days — "
-                      f"BTC and equities are broadly correlated. No strong divergence signal.")
-
-    add('BTC vs S&P 500',  'Market Structure',
-        spx_div,
-        f"BTC {btc_90d:+.1f}% / SPX {spx_90d:+.1f}% (90d)",
-        spx_sig,
+    SignalSpec(
+        'BTC vs S&P 500', 'Market Structure',
         'Compares Bitcoin\'s 90-day return against the S&P 500. Based on Crypto Currently\'s analysis: when BTC diverges sharply below equities, it historically mean-reverts hard (2018, 2022 examples). BTC outperforming by >20% signals late-cycle risk.',
         'BTC underperforms SPX by > 20% (Oversold vs Equities)', 'BTC outperforms SPX by > 20% (Late Cycle)',
-        spx_detail)
+        value=lambda d: d.get('spx_divergence', -33.0),   # btc_90d - spx_90d
+        fmt=lambda v, d: f"BTC {d.get('btc_90d', -28.0):+.1f}% / SPX {d.get('spx_90d', 5.0):+.1f}% (90d)",
+        detail=_spx_detail,
+        zone=lambda v, d: spx_zone(v)),
+]
 
-    return signals
+SIGNAL_SPECS = {spec.name: spec for spec in SIGNAL_REGISTRY}
+
+# classify_signal() cutoffs per indicator, shared with backtest.py and
+# calibrate.py so historical evaluation always uses the live thresholds.
+SIGNAL_THRESHOLDS = {spec.name: spec.thresholds for spec in SIGNAL_REGISTRY if spec.thresholds}
+
+
+def get_all_signals(data):
+    """
+    Returns a list of Signal records for display, one per SIGNAL_REGISTRY entry.
+    Each reads like a dict: {name, category, value, value_str, signal, color, emoji, description, buy_zone, sell_zone, detail}
+    """
+    return [spec.evaluate(data) for spec in SIGNAL_REGISTRY]
 
 
 def compute_overall_verdict(signals):
@@ -943,8 +1100,16 @@ def compute_overall_verdict(signals):
     counts = {'BUY': 0, 'CAUTION': 0, 'SELL': 0}
     for s in signals:
         counts[s['signal']] += 1
+    return verdict_from_counts(counts['BUY'], counts['CAUTION'], counts['SELL'])
 
-    total = len(signals)
+
+def verdict_from_counts(buy_n, caution_n, sell_n):
+    """
+    compute_overall_verdict() from zone counts, for callers that maintain the
+    counts themselves (transitions.py). Same return tuple.
+    """
+    counts = {'BUY': buy_n, 'CAUTION': caution_n, 'SELL': sell_n}
+    total = buy_n + caution_n + sell_n
     buy_pct = counts['BUY'] / total * 100
 
     if buy_pct >= 60:
@@ -976,73 +1141,9 @@ def compute_overall_verdict(signals):
 # ─────────────────────────────────────────────────────────────────────────────
 
 def get_btc_ohlcv_5yr():
-    """Fetch 5 years of daily BTC/USD OHLCV data. Returns a DataFrame with DatetimeIndex."""
-    # Primary: direct Yahoo Finance v8 API (works on Railway, no sandbox dependency)
-    try:
-        url = "https://query1.finance.yahoo.com/v8/finance/chart/BTC-USD"
-        params = {'interval': '1d', 'range': '5y', 'includeAdjustedClose': 'true'}
-        r = requests.get(url, params=params, timeout=20,
-                         headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-        if r.status_code == 200:
-            data = r.json()
-            if data.get('chart', {}).get('result'):
-                result = data['chart']['result'][0]
-                timestamps = result.get('timestamp', [])
-                quotes = result['indicators']['quote'][0]
-                df = pd.DataFrame({
-                    'open':   quotes.get('open', []),
-                    'high':   quotes.get('high', []),
-                    'low':    quotes.get('low', []),
-                    'close':  quotes.get('close', []),
-                    'volume': quotes.get('volume', []),
-                }, index=[datetime.fromtimestamp(t) for t in timestamps])
-                df = df.dropna(subset=['close'])
-                if not df.empty:
-                    return df
-    except Exception as e:
-        print(f"[get_btc_ohlcv_5yr yahoo] {e}")
-
-    # Try sandbox ApiClient if available
+    """5 years of daily BTC/USD OHLCV from the canonical store. Returns a DataFrame with DatetimeIndex."""
     try:
-        from data_api import ApiClient
-        client = ApiClient()
-        r = client.call_api('YahooFinance/get_stock_chart', query={
-            'symbol': 'BTC-USD', 'interval': '1d', 'range': '5y',
-            'includeAdjustedClose': True
-        })
-        if r and 'chart' in r and r['chart'].get('result'):
-            result = r['chart']['result'][0]
-            timestamps = result.get('timestamp', [])
-            quotes = result['indicators']['quote'][0]
-            df = pd.DataFrame({
-                'open':   quotes.get('open', []),
-                'high':   quotes.get('high', []),
-                'low':    quotes.get('low', []),
-                'close':  quotes.get('close', []),
-                'volume': quotes.get('volume', []),
-            }, index=[datetime.fromtimestamp(t) for t in timestamps])
-            df = df.dropna(subset=['close'])
-            if not df.empty:
-                return df
+        return ohlcv_store.daily(days=5 * 365)
     except Exception as e:
-        print(f"[get_btc_ohlcv_5yr sandbox] {e}")
-
-    # Fallback: CoinGecko
-    try:
-        url = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart"
-        params = {'vs_currency': 'usd', 'days': '1825', 'interval': 'daily'}
-        r = requests.get(url, params=params, timeout=20, headers={'User-Agent': 'Mozilla/5.0'})
-        if r.status_code == 200:
-            prices = r.json().get('prices', [])
-            df = pd.DataFrame(prices, columns=['ts', 'close'])
-            df.index = pd.to_datetime(df['ts'], unit='ms')
-            df = df[['close']].dropna()
-            df['open'] = df['close'].shift(1).fillna(df['close'])
-            df['high'] = df['close']
-            df['low']  = df['close']
-            df['volume'] = 0
-            return df
-    except Exception as e:
-        print(f"[get_btc_ohlcv_5yr coingecko] {e}")
-
+        print(f"[get_btc_ohlcv_5yr] {e}")
     return pd.DataFrame()
@@ -0,0 +1,167 @@
+"""
+Local FRED series mirror.
+Keeps every observation of the GLI input series in a SQLite file under
+.fred/ and only asks FRED for observations from the last stored date
+onward (observation_start), so a refresh is a handful of tiny requests
+instead of several 400-day histories. The series sync concurrently, and
+GLI levels are computed from the local arrays — including the full
+history for charting.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import cassette
+import http_client
+import metrics
+
+FRED_URL      = 'https://api.stlouisfed.org/fred/series/observations'
+HISTORY_START = '2003-01-01'   # ECB weekly balance sheet (ECBASSETSW) starts Dec 2002
+SYNC_INTERVAL = 6 * 3600       # balance sheets are weekly/monthly, FX daily
+
+# series_id → description
+GLI_SERIES = {
+    'WALCL':      'Fed total assets (USD millions)',
+    'ECBASSETSW': 'ECB total assets (EUR millions)',
+    'JPNASSETS':  'BoJ total assets (JPY billions)',
+    'DEXUSEU':    'USD per 1 EUR',
+    'DEXJPUS':    'JPY per 1 USD',
+}
+
+STORE_DIR = cassette.isolated_dir(os.path.join(os.path.dirname(__file__), '.fred'))
+DB_FILE   = os.path.join(STORE_DIR, 'fred.sqlite')
+
+_write_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Storage
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _connect():
+    os.makedirs(STORE_DIR, exist_ok=True)
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    conn.execute("""CREATE TABLE IF NOT EXISTS observations (
+                        series_id TEXT NOT NULL,
+                        date      TEXT NOT NULL,
+                        value     REAL NOT NULL,
+                        PRIMARY KEY (series_id, date))""")
+    conn.execute("""CREATE TABLE IF NOT EXISTS sync_state (
+                        series_id TEXT PRIMARY KEY,
+                        synced_at REAL NOT NULL)""")
+    return conn
+
+
+def _last_date(conn, series_id):
+    row = conn.execute("SELECT MAX(date) FROM observations WHERE series_id = ?",
+                       (series_id,)).fetchone()
+    return row[0] if row else None
+
+
+def _synced_at(conn, series_id):
+    row = conn.execute("SELECT synced_at FROM sync_state WHERE series_id = ?",
+                       (series_id,)).fetchone()
+    return row[0] if row else 0.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sync
+# ─────────────────────────────────────────────────────────────────────────────
+
+def sync_series(series_id, fred_key, force=False):
+    """
+    Fetch observations from the last stored date onward and upsert them.
+    The last stored date is re-requested so a revised value replaces it.
+    Returns the number of observations written (0 if skipped or failed).
+    """
+    conn = _connect()
+    try:
+        if not force and time.time() - _synced_at(conn, series_id) < SYNC_INTERVAL:
+            return 0
+        start = _last_date(conn, series_id) or HISTORY_START
+        try:
+            obs = http_client.get_json(FRED_URL, params={
+                'series_id':         series_id,
+                'api_key':           fred_key,
+                'file_type':         'json',
+                'sort_order':        'asc',
+                'observation_start': start,
+            }).get('observations', [])
+        except Exception as e:
+            print(f"[fred_store] {series_id} sync failed: {e}")
+            return 0
+        rows = [(series_id, o['date'], float(o['value'])) for o in obs if o['value'] != '.']
+        with _write_lock, conn:
+            conn.executemany("INSERT OR REPLACE INTO observations VALUES (?, ?, ?)", rows)
+            conn.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (series_id, time.time()))
+        return len(rows)
+    finally:
+        conn.close()
+
+
+def sync_all(fred_key, series_ids=None, force=False):
+    """Sync the given series (default: all GLI inputs) concurrently."""
+    series_ids = list(series_ids or GLI_SERIES)
+    with ThreadPoolExecutor(max_workers=len(series_ids)) as pool:
+        counts = pool.map(metrics.carry(lambda s: sync_series(s, fred_key, force)), series_ids)
+    return dict(zip(series_ids, counts))
+
+
+def series(series_id):
+    """(dates as datetime64[D], values as float64) for every stored observation, oldest first."""
+    conn = _connect()
+    try:
+        rows = conn.execute("SELECT date, value FROM observations WHERE series_id = ? ORDER BY date",
+                            (series_id,)).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return np.array([], dtype='datetime64[D]'), np.array([], dtype='float64')
+    dates, values = zip(*rows)
+    return np.array(dates, dtype='datetime64[D]'), np.array(values, dtype='float64')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GLI
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _as_of(dates, values, at):
+    """Last observation on or before each date in `at` (NaN before the series starts)."""
+    idx = np.searchsorted(dates, at, side='right') - 1
+    out = values[np.clip(idx, 0, None)] if len(values) else np.full(len(at), np.nan)
+    return np.where(idx >= 0, out, np.nan)
+
+
+def gli_at(at):
+    """
+    GLI in USD trillions at each date in `at` (array of datetime64[D]), using the
+    balance sheets and FX rates in effect on that date.
+    """
+    at = np.asarray(at, dtype='datetime64[D]')
+    v = {s: _as_of(*series(s), at) for s in GLI_SERIES}
+    fed_t = v['WALCL'] / 1_000_000
+    ecb_t = v['ECBASSETSW'] * v['DEXUSEU'] / 1_000_000
+    boj_t = v['JPNASSETS'] * 1000 / v['DEXJPUS'] / 1_000_000
+    return fed_t + ecb_t + boj_t
+
+
+def gli_series():
+    """(dates, gli_trillions) on the Fed's weekly reporting dates, for charting."""
+    dates, _ = series('WALCL')
+    if not len(dates):
+        return dates, np.array([], dtype='float64')
+    gli = gli_at(dates)
+    keep = ~np.isnan(gli)
+    return dates[keep], gli[keep]
+
+
+def gli_now_and_year_ago():
+    """(gli_now, gli_12m_ago) in USD trillions from the local mirror."""
+    today = np.datetime64('today', 'D')
+    now, ago = gli_at(np.array([today, today - np.timedelta64(365, 'D')]))
+    return float(now), float(ago)
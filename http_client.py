@@ -0,0 +1,366 @@
+"""
+Shared HTTP client for every upstream call (data_fetcher, app, telegram_bot).
+One requests.Session keeps a keep-alive connection pool per host, so the
+5-minute refresh reuses TCP+TLS connections instead of re-handshaking.
+429 and 5xx responses are retried a bounded number of times with jittered
+exponential backoff. Connection errors and timeouts are not: the breaker
+below handles a host that stops answering, and retrying a timeout only
+multiplies its cost.
+
+Hosts listed in ratelimit.RATE_LIMITS (CoinGecko) draw from a token bucket
+shared by every local process; pass priority=ratelimit.LIVE for requests
+that should win over background backfills.
+
+get_json() remembers each response's ETag / Last-Modified and sends them back
+as If-None-Match / If-Modified-Since; a 304 returns the object decoded last
+time without re-downloading or re-parsing the body. Requests whose params
+change on every call (a window ending at "now") pass validate=False so they
+don't crowd the validator cache.
+
+With CASSETTE_MODE=record|replay set, request() records every response to a
+cassette or serves it back instead of touching the network (see cassette.py).
+
+Each host also has a circuit breaker (closed → open → half-open). After
+FAILURE_THRESHOLD consecutive failed requests (a request's retries count
+once; any requests exception is a failure) the host is skipped for
+COOLDOWN_SECONDS: calls raise CircuitOpenError immediately, so callers go
+straight to their fallback instead of waiting out another timeout. The
+half-open probe is a single attempt, and every failed probe doubles the
+cooldown (up to COOLDOWN_MAX). Pass breaker=False for calls whose failures
+say nothing about the host, such as a Telegram long-poll.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import cassette
+import metrics
+import ratelimit
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+DEFAULT_TIMEOUT = 12
+
+# Per-host timeouts (seconds). An explicit timeout= on a call overrides these.
+HOST_TIMEOUTS = {
+    'api.coingecko.com':        10,
+    'query1.finance.yahoo.com': 8,
+    'api.stlouisfed.org':       12,
+    'open-api.coinglass.com':   8,
+    'colintalkscrypto.com':     10,
+    'api.alternative.me':       10,
+    'api.frankfurter.app':      8,
+    'open.er-api.com':          8,
+    'api.telegram.org':         10,
+}
+
+MAX_RETRIES   = 2      # extra attempts after a 429/5xx, GET only by default
+BACKOFF_BASE  = 0.5    # seconds; attempt n sleeps ~BACKOFF_BASE * 2**n
+BACKOFF_MAX   = 4.0
+RETRY_STATUS  = {429, 500, 502, 503, 504}
+POOL_MAXSIZE  = 8      # keep-alive connections per host (fetchers run concurrently)
+
+FAILURE_THRESHOLD = 3    # consecutive failed requests before a host's circuit opens
+COOLDOWN_SECONDS  = 300  # first skip before a probe; at least one refresh interval
+COOLDOWN_MAX      = 3600 # cap for the cooldown, doubled after each failed probe
+
+VALIDATOR_CACHE_SIZE = 256   # (url, params) entries kept for conditional GETs
+
+_session = None
+_session_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Circuit breakers
+# ─────────────────────────────────────────────────────────────────────────────
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+    def __init__(self, host, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN_SECONDS,
+                 cooldown_max=COOLDOWN_MAX):
+        self.host = host
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.cooldown_max = cooldown_max
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        True if a request may go out now. In half-open, only one probe at a time
+        (while it is out, `probing` is True).
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.time() - self.opened_at < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+                print(f"[HTTP] Circuit HALF-OPEN for {self.host} — probing")
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    @property
+    def probing(self):
+        return self.state == self.HALF_OPEN
+
+    def cancel_probe(self):
+        """The allowed request never went out (e.g. rate limited); free the probe slot."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                print(f"[HTTP] Circuit CLOSED for {self.host}")
+            self.state = self.CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.cooldown_max)
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.threshold):
+                self.state = self.OPEN
+                self.opened_at = time.time()
+                print(f"[HTTP] Circuit OPEN for {self.host} after {self.failures} failures "
+                      f"— skipping for {self.cooldown}s")
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(host):
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def breaker_states():
+    """{host: state} for every host seen so far."""
+    return {host: b.state for host, b in _breakers.items()}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Requests
+# ─────────────────────────────────────────────────────────────────────────────
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=len(HOST_TIMEOUTS) + 4,
+                                      pool_maxsize=POOL_MAXSIZE)
+                s.mount('https://', adapter)
+                s.mount('http://', adapter)
+                s.headers.update(DEFAULT_HEADERS)
+                _session = s
+    return _session
+
+
+def host_of(url):
+    return urlsplit(url).hostname or ''
+
+
+def timeout_for(url):
+    return HOST_TIMEOUTS.get(host_of(url), DEFAULT_TIMEOUT)
+
+
+def _backoff(attempt):
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _send(method, url, params=None, json=None, headers=None, timeout=None, retries=None,
+         priority=ratelimit.NORMAL, breaker=True):
+    """
+    Send a request through the shared session.
+    Returns the final requests.Response (which may still be a 429/5xx once
+    retries are exhausted); raises the requests exception if the attempt
+    failed at the transport level, CircuitOpenError if the host is currently
+    being skipped, or RateLimitedError if no rate-limit token was available
+    in time. breaker=False neither checks nor feeds the host's breaker.
+    """
+    if timeout is None:
+        timeout = timeout_for(url)
+    if retries is None:
+        retries = MAX_RETRIES if method == 'GET' else 0
+
+    session = get_session()
+    host = host_of(url)
+    cb = breaker_for(host) if breaker else None
+    if cb is not None:
+        if not cb.allow():
+            metrics.record('http', host, error='circuit open')
+            raise CircuitOpenError(f"circuit open for {host}")
+        if cb.probing:
+            retries = 0   # one attempt decides the probe
+
+    # One breaker outcome per logical request, however many attempts it took.
+    # Anything that leaves it None (rate limited, a non-requests error) only
+    # frees the half-open probe slot.
+    outcome = None
+    try:
+        for attempt in range(retries + 1):
+            try:
+                ratelimit.acquire(host, priority)
+            except ratelimit.RateLimitedError:
+                metrics.record('http', host, error='rate limited')
+                raise
+            t0 = time.perf_counter()
+            try:
+                r = session.request(method, url, params=params, json=json,
+                                    headers=headers, timeout=timeout)
+            except requests.RequestException as e:
+                metrics.record('http', host, duration=time.perf_counter() - t0,
+                               error=type(e).__name__)
+                outcome = 'failure'
+                raise
+            metrics.record('http', host, duration=time.perf_counter() - t0,
+                           status=r.status_code, nbytes=len(r.content))
+            retry_after = r.headers.get('Retry-After', '')
+            if r.status_code == 429 and ratelimit.is_limited(host):
+                ratelimit.penalize(host, float(retry_after) if retry_after.isdigit() else 60)
+            if r.status_code not in RETRY_STATUS:
+                outcome = 'success'
+                return r
+            if attempt >= retries:
+                outcome = 'failure'
+                return r
+            if retry_after.isdigit():
+                time.sleep(min(float(retry_after), BACKOFF_MAX))
+            else:
+                time.sleep(_backoff(attempt))
+    finally:
+        if cb is None:
+            pass
+        elif outcome == 'success':
+            cb.record_success()
+        elif outcome == 'failure':
+            cb.record_failure()
+        else:
+            cb.cancel_probe()
+
+
+def request(method, url, params=None, json=None, headers=None, timeout=None, retries=None,
+            priority=ratelimit.NORMAL, breaker=True):
+    """
+    Send a request (see _send for retry / breaker / rate-limit behaviour).
+    When a cassette is active the response is recorded, or replayed without
+    any network access.
+    """
+    if cassette.replaying():
+        t0 = time.perf_counter()
+        try:
+            r = cassette.play(method, url, params, json)
+        except requests.RequestException as e:
+            metrics.record('http', host_of(url), duration=time.perf_counter() - t0,
+                           error=type(e).__name__)
+            raise
+        metrics.record('http', host_of(url), duration=time.perf_counter() - t0,
+                       status=r.status_code, nbytes=len(r.content))
+        return r
+    if not cassette.recording():
+        return _send(method, url, params, json, headers, timeout, retries, priority, breaker)
+
+    t0 = time.perf_counter()
+    try:
+        r = _send(method, url, params, json, headers, timeout, retries, priority, breaker)
+    except requests.RequestException as e:
+        cassette.record(method, url, params, json, time.perf_counter() - t0, error=e)
+        raise
+    cassette.record(method, url, params, json, time.perf_counter() - t0, response=r)
+    return r
+
+
+def get(url, params=None, headers=None, timeout=None, retries=None, priority=ratelimit.NORMAL,
+        breaker=True):
+    return request('GET', url, params=params, headers=headers, timeout=timeout, retries=retries,
+                   priority=priority, breaker=breaker)
+
+
+def post(url, json=None, headers=None, timeout=None, retries=None, priority=ratelimit.NORMAL,
+         breaker=True):
+    return request('POST', url, json=json, headers=headers, timeout=timeout, retries=retries,
+                   priority=priority, breaker=breaker)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Conditional GET
+# ─────────────────────────────────────────────────────────────────────────────
+
+_validators = OrderedDict()   # (url, params) → (etag, last_modified, decoded body)
+_validators_lock = threading.Lock()
+
+
+def _validator_key(url, params):
+    return url, tuple(sorted((params or {}).items()))
+
+
+def get_json(url, params=None, headers=None, timeout=None, retries=None, priority=ratelimit.NORMAL,
+             validate=True):
+    """
+    GET and decode a JSON body, revalidating with ETag / Last-Modified when a
+    previous response carried them. A 304 returns the previously decoded
+    object (shared — treat it as read-only). Raises requests.HTTPError on 4xx/5xx.
+    validate=False skips the validator cache for one-off params that can never 304.
+    """
+    if not validate:
+        r = get(url, params=params, headers=headers, timeout=timeout, retries=retries, priority=priority)
+        r.raise_for_status()
+        return r.json()
+    key = _validator_key(url, params)
+    with _validators_lock:
+        cached = _validators.get(key)
+    headers = dict(headers or {})
+    if cached and not cassette.recording():   # cassettes always hold full bodies
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    r = get(url, params=params, headers=headers, timeout=timeout, retries=retries, priority=priority)
+    if r.status_code == 304 and cached:
+        with _validators_lock:
+            _validators.move_to_end(key)
+        return cached[2]
+    r.raise_for_status()
+    data = r.json()
+
+    etag, last_modified = r.headers.get('ETag'), r.headers.get('Last-Modified')
+    with _validators_lock:
+        if etag or last_modified:
+            _validators[key] = (etag, last_modified, data)
+            _validators.move_to_end(key)
+            while len(_validators) > VALIDATOR_CACHE_SIZE:
+                _validators.popitem(last=False)
+        else:
+            _validators.pop(key, None)
+    return data
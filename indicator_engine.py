@@ -0,0 +1,212 @@
+"""
+Vectorized price-indicator engine.
+Computes complete, date-aligned series for every price-derived indicator
+(RSI-14, weekly RSI, 50d / 200d / 111d / 350d / 2-year / 200-week MAs,
+Mayer Multiple, Pi Cycle) in one pass over the close array. All rolling
+means over one array come from a single shared cumulative-sum buffer.
+
+compute_indicators() takes its latest values from here, and full_history()
+memoizes the whole-history frame per OHLCV store version so charts,
+backtests and alerts reuse it instead of recomputing.
+
+RSI uses Wilder smoothing with the same recurrence as
+pandas .ewm(com=period-1, adjust=False): the first delta seeds the
+averages and a zero average loss yields NaN.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+RSI_PERIOD = 14
+DAILY_WINDOWS  = (50, 111, 200, 350)
+WEEKLY_WINDOWS = (104, 200)     # 2-year MA, 200-week MA
+PI_CAUTION = 0.85
+
+_memo = {'key': None, 'frame': None}
+_memo_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Primitives
+# ─────────────────────────────────────────────────────────────────────────────
+
+def cumsum0(values):
+    """Cumulative sum with a leading 0, so window sums are cs[i+1] - cs[i+1-n]."""
+    cs = np.empty(len(values) + 1, dtype='float64')
+    cs[0] = 0.0
+    np.cumsum(values, out=cs[1:])
+    return cs
+
+
+def rolling_means(values, windows, cs=None):
+    """{n: trailing n-bar mean} for each window, NaN until n bars exist, sharing one cumsum."""
+    values = np.asarray(values, dtype='float64')
+    if cs is None:
+        cs = cumsum0(values)
+    out = {}
+    for n in windows:
+        m = np.full(len(values), np.nan)
+        if len(values) >= n:
+            m[n - 1:] = (cs[n:] - cs[:-n]) / n
+        out[n] = m
+    return out
+
+
+def wilder_step(avg, x, period=RSI_PERIOD):
+    """One Wilder/EWM step: avg is None before the first delta."""
+    alpha = 1.0 / period
+    return x if avg is None else (1 - alpha) * avg + alpha * x
+
+
+def rsi_from_averages(avg_g, avg_l):
+    """RSI from average gain/loss (scalars or arrays); NaN where avg_l is 0."""
+    avg_g = np.asarray(avg_g, dtype='float64')
+    avg_l = np.asarray(avg_l, dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = np.where(avg_l == 0, np.nan, avg_g / avg_l)
+        return 100 - (100 / (1 + rs))
+
+
+def wilder_averages(values, period=RSI_PERIOD):
+    """(avg_gain, avg_loss) arrays; index 0 is NaN (no delta yet)."""
+    values = np.asarray(values, dtype='float64')
+    n = len(values)
+    avg_g = np.full(n, np.nan)
+    avg_l = np.full(n, np.nan)
+    if n < 2:
+        return avg_g, avg_l
+    delta = np.diff(values)
+    gains = np.maximum(delta, 0.0).tolist()
+    losses = np.maximum(-delta, 0.0).tolist()
+    g = l = None
+    out_g, out_l = [], []
+    for x, y in zip(gains, losses):
+        g = wilder_step(g, x, period)
+        l = wilder_step(l, y, period)
+        out_g.append(g)
+        out_l.append(l)
+    avg_g[1:] = out_g
+    avg_l[1:] = out_l
+    return avg_g, avg_l
+
+
+def rsi(values, period=RSI_PERIOD):
+    return rsi_from_averages(*wilder_averages(values, period))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Indicator sets
+# ─────────────────────────────────────────────────────────────────────────────
+
+def daily_indicators(close):
+    """Series aligned with `close` (daily bars): RSI-14, MAs, Mayer, Pi Cycle."""
+    close = np.asarray(close, dtype='float64')
+    ma = rolling_means(close, DAILY_WINDOWS)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mayer = close / ma[200]
+        pi_ratio = ma[111] / (ma[350] * 2)
+    return {
+        'rsi_14':       rsi(close),
+        'ma_50d':       ma[50],
+        'ma_111d':      ma[111],
+        'ma_200d':      ma[200],
+        'ma_350d_x2':   ma[350] * 2,
+        'mayer':        mayer,
+        'pi_ratio':     pi_ratio,
+        'pi_triggered': ma[111] >= ma[350] * 2,   # False while either MA is NaN
+    }
+
+
+def weekly_indicators(wclose):
+    """Series aligned with `wclose` (weekly bars): weekly RSI, 2-year and 200-week MAs."""
+    wclose = np.asarray(wclose, dtype='float64')
+    ma = rolling_means(wclose, WEEKLY_WINDOWS)
+    return {
+        'rsi_weekly': rsi(wclose),
+        'ma_2yr':     ma[104],
+        'ma_200w':    ma[200],
+    }
+
+
+def week_start_days(days):
+    """Monday-start week (epoch day) for each epoch day — 1970-01-01 was a Thursday."""
+    days = np.asarray(days, dtype='int64')
+    return days - (days + 3) % 7
+
+
+def weekly_asof_daily(days, close):
+    """
+    Weekly indicators evaluated on every daily bar, treating that day's close
+    as the close of a still-forming week — exactly what compute_indicators
+    sees from ohlcv_store.weekly() on that day, with no look-ahead.
+    """
+    close = np.asarray(close, dtype='float64')
+    weeks = week_start_days(days)
+    # position of each day's week among the distinct weeks, and each week's final close
+    _, week_pos = np.unique(weeks, return_inverse=True)
+    last_in_week = np.r_[np.nonzero(np.diff(week_pos))[0], len(close) - 1]
+    wfinal = close[last_in_week]
+    k = week_pos                         # completed weeks before day d are wfinal[:k]
+
+    cs = cumsum0(wfinal)
+    out = {}
+    for name, n in (('ma_2yr', 104), ('ma_200w', 200)):
+        m = np.full(len(close), np.nan)
+        ok = k >= n - 1
+        m[ok] = (cs[k[ok]] - cs[k[ok] - (n - 1)] + close[ok]) / n
+        out[name] = m
+
+    # Wilder state after the completed weeks, then one step with today's partial bar
+    avg_g, avg_l = wilder_averages(wfinal)
+    prev = np.where(k > 0, wfinal[np.maximum(k - 1, 0)], np.nan)
+    delta = close - prev
+    g, l = np.maximum(delta, 0.0), np.maximum(-delta, 0.0)
+    alpha = 1.0 / RSI_PERIOD
+    prev_g = avg_g[np.maximum(k - 1, 0)]
+    prev_l = avg_l[np.maximum(k - 1, 0)]
+    seeded = k >= 2                      # a Wilder average exists for week k-1
+    step_g = np.where(seeded, (1 - alpha) * prev_g + alpha * g, g)
+    step_l = np.where(seeded, (1 - alpha) * prev_l + alpha * l, l)
+    r = rsi_from_averages(step_g, step_l)
+    out['rsi_weekly'] = np.where(k >= 1, r, np.nan)
+    return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Full history
+# ─────────────────────────────────────────────────────────────────────────────
+
+def compute_frame(df_daily):
+    """DataFrame of every price indicator on `df_daily`'s index (daily + as-of weekly)."""
+    if df_daily is None or df_daily.empty:
+        return pd.DataFrame()
+    close = df_daily['close'].to_numpy(dtype='float64')
+    days = df_daily.index.values.astype('datetime64[D]').astype('int64')
+    cols = {'close': close}
+    cols.update(daily_indicators(close))
+    cols.update(weekly_asof_daily(days, close))
+    frame = pd.DataFrame(cols, index=df_daily.index)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frame['pct_above_200w'] = (close - frame['ma_200w']) / frame['ma_200w'] * 100
+        frame['ma_2yr_ratio'] = close / frame['ma_2yr']
+    return frame
+
+
+def full_history():
+    """
+    Indicator frame over the whole OHLCV store, recomputed only when the
+    store changes. Treat the returned frame as read-only.
+    """
+    import ohlcv_store
+    df = ohlcv_store.daily()
+    key = (len(df), df.index[-1], float(df['close'].iloc[-1])) if len(df) else None
+    with _memo_lock:
+        if _memo['key'] == key and _memo['frame'] is not None:
+            return _memo['frame']
+    frame = compute_frame(df)
+    with _memo_lock:
+        _memo['key'] = key
+        _memo['frame'] = frame
+    return frame
@@ -0,0 +1,245 @@
+"""
+Streaming price-indicator state.
+Holds the Wilder RSI averages, running window sums and ring buffers for the
+daily and weekly indicators, so moving to a new bar — or re-pricing the
+still-forming live bar — is O(1) instead of re-running EWM and rolling means
+over the whole history every refresh.
+
+Every stored bar except the last is "committed" into the state; the last
+bar is the live bar and is evaluated on top of the state without mutating
+it. The state is persisted as JSON next to the OHLCV store and rebuilt from
+scratch whenever it no longer lines up with the stored history.
+
+values() matches indicator_engine.compute_frame(ohlcv_store.daily()).iloc[-1]:
+RSI exactly (same recurrence), moving averages to floating-point rounding.
+"""
+
+import json
+import os
+import threading
+from collections import deque
+
+import numpy as np
+
+import indicator_engine as engine
+
+DAILY_WINDOWS  = engine.DAILY_WINDOWS
+WEEKLY_WINDOWS = engine.WEEKLY_WINDOWS
+STATE_VERSION  = 1
+
+_lock = threading.Lock()
+_stream = None
+
+
+def _state_file():
+    import ohlcv_store
+    return os.path.join(ohlcv_store.STORE_DIR, 'indicator_state.json')
+
+
+class _Series:
+    """Wilder averages + running window sums over committed bars of one timeframe."""
+
+    def __init__(self, windows):
+        self.windows = tuple(windows)
+        self.buf = deque(maxlen=max(self.windows))
+        self.sums = {n: 0.0 for n in self.windows}
+        self.avg_g = None
+        self.avg_l = None
+        self.count = 0
+
+    def commit(self, x):
+        if self.buf:
+            delta = x - self.buf[-1]
+            self.avg_g = engine.wilder_step(self.avg_g, max(delta, 0.0))
+            self.avg_l = engine.wilder_step(self.avg_l, max(-delta, 0.0))
+        for n in self.windows:
+            self.sums[n] += x
+            if len(self.buf) >= n:
+                self.sums[n] -= self.buf[-n]
+        self.buf.append(x)
+        self.count += 1
+
+    def evaluate(self, live):
+        """(rsi, {n: mean}) with `live` as the next, uncommitted bar."""
+        if self.buf:
+            delta = live - self.buf[-1]
+            g = engine.wilder_step(self.avg_g, max(delta, 0.0))
+            l = engine.wilder_step(self.avg_l, max(-delta, 0.0))
+            rsi = float(engine.rsi_from_averages(g, l))
+        else:
+            rsi = float('nan')
+        means = {}
+        for n in self.windows:
+            if len(self.buf) >= n - 1:
+                last_n_minus_1 = self.sums[n] - (self.buf[-n] if len(self.buf) >= n else 0.0)
+                means[n] = (last_n_minus_1 + live) / n
+            else:
+                means[n] = float('nan')
+        return rsi, means
+
+    def to_dict(self):
+        return {'buf': list(self.buf), 'sums': {str(n): s for n, s in self.sums.items()},
+                'avg_g': self.avg_g, 'avg_l': self.avg_l, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, windows, d):
+        s = cls(windows)
+        s.buf.extend(d['buf'])
+        s.sums = {n: d['sums'][str(n)] for n in s.windows}
+        s.avg_g, s.avg_l, s.count = d['avg_g'], d['avg_l'], d['count']
+        return s
+
+
+class StreamingIndicators:
+    """Daily + weekly streaming state over the stored daily bars."""
+
+    def __init__(self):
+        self.daily = _Series(DAILY_WINDOWS)
+        self.weekly = _Series(WEEKLY_WINDOWS)
+        self.last_day = None          # epoch day of the last committed daily bar
+        self.last_close = None
+        self.week = None              # week start (epoch day) of the last committed bar
+        self.week_close = None        # that week's close so far
+        self.live_day = None
+        self.live_close = None
+
+    # ── Updates ──
+
+    def commit_bar(self, day, close):
+        """Append one final daily bar. O(1)."""
+        week = int(engine.week_start_days(day))
+        if self.week is not None and week != self.week:
+            self.weekly.commit(self.week_close)
+        self.daily.commit(close)
+        self.last_day, self.last_close = int(day), float(close)
+        self.week, self.week_close = week, float(close)
+
+    def set_live(self, day, close):
+        """Set or re-price the forming bar. O(1)."""
+        self.live_day, self.live_close = int(day), float(close)
+
+    def sync(self, days, closes):
+        """
+        Bring the state in line with the stored bars (all but the last are final).
+        Commits only bars newer than the state; rebuilds if the history diverged.
+        Returns True if committed state changed.
+        """
+        days = np.asarray(days, dtype='int64')
+        closes = np.asarray(closes, dtype='float64')
+        n = len(days)
+        if n == 0:
+            return False
+        done = self.daily.count
+        aligned = (done <= n - 1 and
+                   (done == 0 or (days[done - 1] == self.last_day and closes[done - 1] == self.last_close)))
+        changed = False
+        if not aligned:
+            self.__init__()
+            done = 0
+            changed = True
+        for i in range(done, n - 1):
+            self.commit_bar(days[i], closes[i])
+            changed = True
+        self.set_live(days[-1], closes[-1])
+        return changed
+
+    # ── Reads ──
+
+    def values(self):
+        """Latest indicator values with the live bar applied (same keys as the engine frame)."""
+        live = self.live_close
+        if live is None:
+            return {}
+        rsi_d, ma = self.daily.evaluate(live)
+        nan = float('nan')
+        ma350x2 = ma[350] * 2
+        pi_ratio = ma[111] / ma350x2 if ma350x2 and not np.isnan(ma350x2) else nan
+
+        # Weekly: the live bar either extends the last committed week or starts a new one
+        if self.week is not None and int(engine.week_start_days(self.live_day)) != self.week:
+            weekly = _Series.from_dict(WEEKLY_WINDOWS, self.weekly.to_dict())
+            weekly.commit(self.week_close)
+        else:
+            weekly = self.weekly
+        rsi_w, wma = weekly.evaluate(live)
+        if not weekly.buf:
+            rsi_w = nan
+
+        return {
+            'close':          live,
+            'rsi_14':         rsi_d,
+            'ma_50d':         ma[50],
+            'ma_111d':        ma[111],
+            'ma_200d':        ma[200],
+            'ma_350d_x2':     ma350x2,
+            'mayer':          live / ma[200] if ma[200] else nan,
+            'pi_ratio':       pi_ratio,
+            'pi_triggered':   bool(ma[111] >= ma350x2),
+            'ma_2yr':         wma[104],
+            'ma_200w':        wma[200],
+            'rsi_weekly':     rsi_w,
+            'pct_above_200w': (live - wma[200]) / wma[200] * 100 if wma[200] else nan,
+            'ma_2yr_ratio':   live / wma[104] if wma[104] else nan,
+        }
+
+    # ── Persistence ──
+
+    def to_dict(self):
+        return {'version': STATE_VERSION, 'daily': self.daily.to_dict(), 'weekly': self.weekly.to_dict(),
+                'last_day': self.last_day, 'last_close': self.last_close,
+                'week': self.week, 'week_close': self.week_close}
+
+    @classmethod
+    def from_dict(cls, d):
+        s = cls()
+        if d.get('version') != STATE_VERSION:
+            return s
+        s.daily = _Series.from_dict(DAILY_WINDOWS, d['daily'])
+        s.weekly = _Series.from_dict(WEEKLY_WINDOWS, d['weekly'])
+        s.last_day, s.last_close = d['last_day'], d['last_close']
+        s.week, s.week_close = d['week'], d['week_close']
+        return s
+
+
+def _load():
+    try:
+        with open(_state_file()) as f:
+            return StreamingIndicators.from_dict(json.load(f))
+    except FileNotFoundError:
+        return StreamingIndicators()
+    except Exception as e:
+        print(f"[indicator_stream] Could not load state, rebuilding: {e}")
+        return StreamingIndicators()
+
+
+def _save(stream):
+    try:
+        path = _state_file()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(stream.to_dict(), f)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"[indicator_stream] Could not save state: {e}")
+
+
+def update(df_daily=None):
+    """
+    Sync the process-wide streaming state with the OHLCV store (or `df_daily`)
+    and return its latest values. Only new bars are folded in.
+    """
+    global _stream
+    if df_daily is None:
+        import ohlcv_store
+        df_daily = ohlcv_store.daily()
+    if df_daily is None or df_daily.empty:
+        return {}
+    days = df_daily.index.values.astype('datetime64[D]').astype('int64')
+    closes = df_daily['close'].to_numpy(dtype='float64')
+    with _lock:
+        if _stream is None:
+            _stream = _load()
+        if _stream.sync(days, closes):
+            _save(_stream)
+        return _stream.values()
@@ -0,0 +1,174 @@
+"""
+Upstream call instrumentation.
+Every HTTP attempt (http_client), cache lookup (source_cache) and fetcher
+job (data_fetcher) appends one small event to an in-memory ring buffer:
+duration, bytes, status, cache hit/miss and whether a fallback source was
+used. summary() turns the buffer into p50/p95/p99 per source and
+dump_json() writes it out, so it is easy to see which source dominates a
+refresh cycle.
+
+Events recorded while a span() is open are also attached to that span,
+which is how a fetcher's totals (bytes, cache hits, fallback) are derived
+from the calls it made. Open spans live in a ContextVar; work handed to a
+thread pool inside a span is submitted through carry() so its calls are
+attributed to the span too.
+"""
+
+import contextvars
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+
+RING_SIZE = 4096
+
+_events = deque(maxlen=RING_SIZE)
+_spans = contextvars.ContextVar('metrics_spans', default=())   # event lists of the open spans
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Recording
+# ─────────────────────────────────────────────────────────────────────────────
+
+def record(kind, source, duration=0.0, status=None, nbytes=0, cache=None,
+           fallback=False, error=None):
+    """
+    Append one event. kind is 'http', 'cache' or 'fetch'; source is a host,
+    URL or fetcher name; duration is in seconds.
+    """
+    event = {
+        'ts':          time.time(),
+        'kind':        kind,
+        'source':      source,
+        'duration_ms': round(duration * 1000, 1),
+        'status':      status,
+        'bytes':       nbytes,
+        'cache':       cache,
+        'fallback':    fallback,
+        'error':       error,
+    }
+    _events.append(event)   # deque.append is atomic
+    for span_events in _spans.get():
+        span_events.append(event)
+    return event
+
+
+def _failed(event):
+    return event['error'] is not None or (event['status'] or 0) >= 400
+
+
+def _used_fallback(children):
+    """
+    True if a stale cache entry was served, or a call to one source failed and
+    a different source was tried afterwards.
+    """
+    failed = set()
+    for ev in children:
+        if ev['fallback']:
+            return True
+        if ev['kind'] != 'http':
+            continue
+        if _failed(ev):
+            failed.add(ev['source'])
+        elif failed - {ev['source']}:
+            return True
+    return False
+
+
+@contextmanager
+def span(source):
+    """Time a block as one 'fetch' event, rolling up the calls made inside it."""
+    children = []
+    token = _spans.set(_spans.get() + (children,))
+    t0 = time.perf_counter()
+    error = None
+    try:
+        yield
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _spans.reset(token)
+        http = [ev for ev in children if ev['kind'] == 'http']
+        caches = [ev['cache'] for ev in children if ev['kind'] == 'cache']
+        record('fetch', source,
+               duration=time.perf_counter() - t0,
+               status=http[-1]['status'] if http else None,
+               nbytes=sum(ev['bytes'] for ev in http),
+               cache=('hit' if caches and all(c == 'hit' for c in caches) else
+                      'miss' if caches else None),
+               fallback=_used_fallback(children),
+               error=error)
+
+
+def carry(fn):
+    """
+    Wrap fn so that, run on a pool thread, it records into the spans open
+    where carry() was called. Each call gets its own copy of the context,
+    so the wrapper may run on several threads at once.
+    """
+    ctx = contextvars.copy_context()
+
+    @wraps(fn)
+    def inner(*args, **kwargs):
+        return ctx.copy().run(fn, *args, **kwargs)
+    return inner
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reporting
+# ─────────────────────────────────────────────────────────────────────────────
+
+def events(kind=None):
+    """Snapshot of the ring buffer, oldest first, optionally filtered by kind."""
+    evs = list(_events)
+    return [ev for ev in evs if kind is None or ev['kind'] == kind]
+
+
+def summary(kind='fetch'):
+    """
+    {source: {count, p50_ms, p95_ms, p99_ms, max_ms, errors, bytes, cache_hits,
+    fallbacks}} for events of `kind`, slowest p95 first.
+    """
+    by_source = {}
+    for ev in events(kind):
+        by_source.setdefault(ev['source'], []).append(ev)
+    out = {}
+    for source, evs in by_source.items():
+        ms = np.array([ev['duration_ms'] for ev in evs])
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        out[source] = {
+            'count':      len(evs),
+            'p50_ms':     round(float(p50), 1),
+            'p95_ms':     round(float(p95), 1),
+            'p99_ms':     round(float(p99), 1),
+            'max_ms':     round(float(ms.max()), 1),
+            'errors':     sum(1 for ev in evs if _failed(ev)),
+            'bytes':      sum(ev['bytes'] for ev in evs),
+            'cache_hits': sum(1 for ev in evs if ev['cache'] == 'hit'),
+            'fallbacks':  sum(1 for ev in evs if ev['fallback']),
+        }
+    return dict(sorted(out.items(), key=lambda kv: kv[1]['p95_ms'], reverse=True))
+
+
+def dump_json(path=None, include_events=False):
+    """Summaries for every kind as a JSON string; also written atomically to `path` if given."""
+    report = {
+        'generated_at': time.time(),
+        'fetch': summary('fetch'),
+        'http':  summary('http'),
+        'cache': summary('cache'),
+    }
+    if include_events:
+        report['events'] = events()
+    text = json.dumps(report, indent=2, default=str)
+    if path:
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    return text
@@ -0,0 +1,198 @@
+"""
+Canonical BTC-USD daily OHLCV history.
+Every price-derived consumer (1y daily frame, 200-week / 2-year MAs, 90-day
+return, 5-year chart, market meta) slices or resamples this one series
+instead of downloading its own overlapping window.
+
+Bars are persisted column-major in a single .npy file under .ohlcv/ and
+loaded with a memory map, so the DataFrames handed to compute_indicators
+and the chart tab are zero-copy views of the file. Each refresh only asks
+upstream for bars from the last stored date onward: new days are appended
+and the last stored (possibly still-forming) bar is repaired in place.
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import cassette
+import providers
+
+SYMBOL            = 'BTC-USD'
+HISTORY_RANGE     = '10y'   # enough for the 200-week MA with room to spare
+HISTORY_DAYS      = 3650
+REFRESH_INTERVAL  = 60      # seconds; concurrent fetchers in one cycle share a refresh
+
+STORE_DIR  = cassette.isolated_dir(os.path.join(os.path.dirname(__file__), '.ohlcv'))
+STORE_FILE = os.path.join(STORE_DIR, 'btc_usd_1d.npy')   # (n, 6) float64: epoch day + COLUMNS
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+_df = None
+_meta = {}
+_refreshed_at = 0.0
+_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Fetching
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _chart_to_df(chart):
+    """Yahoo chart JSON → (daily DataFrame indexed by UTC date, meta)."""
+    if not chart or not chart.get('chart', {}).get('result'):
+        return None, {}
+    result = chart['chart']['result'][0]
+    quotes = result['indicators']['quote'][0]
+    df = pd.DataFrame({c: quotes.get(c, []) for c in COLUMNS},
+                      index=pd.to_datetime(result.get('timestamp', []), unit='s').normalize())
+    df.index.name = 'date'
+    df = df.dropna(subset=['close'])
+    return df[~df.index.duplicated(keep='last')], result.get('meta', {})
+
+
+def _fetch_yahoo(since=None):
+    """Daily bars from `since` (a Timestamp, inclusive) to now, or the full history if None."""
+    if since is None:
+        chart = providers.chart(SYMBOL, range_=HISTORY_RANGE)
+    else:
+        chart = providers.chart(SYMBOL, period1=since.timestamp())
+    df, meta = _chart_to_df(chart)
+    return (df, meta) if df is not None and not df.empty else (None, {})
+
+
+def _fetch_coingecko(days):
+    """Close-only fallback; open/high/low are synthesised from closes."""
+    try:
+        prices = providers.coin_history(days)
+        if prices:
+            df = pd.DataFrame(prices, columns=['ts', 'close'])
+            df.index = pd.to_datetime(df['ts'], unit='ms').normalize()
+            df.index.name = 'date'
+            df = df[['close']].dropna()
+            df = df[~df.index.duplicated(keep='last')]
+            df['open'] = df['close'].shift(1).fillna(df['close'])
+            df['high'] = df['close']
+            df['low']  = df['close']
+            df['volume'] = 0
+            return df[COLUMNS]
+    except Exception as e:
+        print(f"[ohlcv_store coingecko] {e}")
+    return None
+
+
+def _merge(old, new):
+    """Append new bars; overlapping dates (e.g. today's partial bar) take the new values."""
+    if old is None or old.empty:
+        return new
+    merged = pd.concat([old, new])
+    return merged[~merged.index.duplicated(keep='last')].sort_index()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Persistence
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _load_disk():
+    """Memory-map the stored bars. The returned DataFrame is a read-only view of the file."""
+    try:
+        arr = np.load(STORE_FILE, mmap_mode='r')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[ohlcv_store] Could not load {STORE_FILE}: {e}")
+        return None
+    if arr.ndim != 2 or arr.shape[1] != len(COLUMNS) + 1 or not len(arr):
+        return None
+    index = pd.DatetimeIndex(arr[:, 0].astype('int64').astype('datetime64[D]'), name='date')
+    return pd.DataFrame(arr[:, 1:], index=index, columns=COLUMNS, copy=False)
+
+
+def _save_disk(df):
+    """Atomically replace the store file; readers holding the old memory map keep a valid view."""
+    try:
+        os.makedirs(STORE_DIR, exist_ok=True)
+        days = df.index.values.astype('datetime64[D]').astype('int64').astype('float64')
+        arr = np.empty((len(df), len(COLUMNS) + 1), dtype='float64', order='F')
+        arr[:, 0] = days
+        arr[:, 1:] = df[COLUMNS].to_numpy(dtype='float64')
+        tmp = f"{STORE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp.npy"   # np.save appends .npy otherwise
+        np.save(tmp, arr)
+        os.replace(tmp, STORE_FILE)
+        return True
+    except Exception as e:
+        print(f"[ohlcv_store] Could not save {STORE_FILE}: {e}")
+        return False
+
+
+def refresh(force=False):
+    """Bring the store up to date. Cheap no-op if refreshed within REFRESH_INTERVAL."""
+    global _df, _meta, _refreshed_at
+    with _lock:
+        if not force and _df is not None and time.time() - _refreshed_at < REFRESH_INTERVAL:
+            return
+        if _df is None:
+            _df = _load_disk()
+
+        # Re-request the last stored bar too, so a partial day gets repaired
+        since = None if _df is None or _df.empty else _df.index[-1]
+        new, meta = _fetch_yahoo(since)
+        if new is None:
+            days = HISTORY_DAYS if since is None else (pd.Timestamp.now('UTC').tz_localize(None) - since).days + 1
+            new = _fetch_coingecko(days)
+
+        if new is not None and not new.empty:
+            new = new[COLUMNS].astype('float64')
+            merged = _merge(_df, new)
+            unchanged = (_df is not None and len(merged) == len(_df)
+                         and merged.iloc[-len(new):].equals(_df.iloc[-len(new):]))
+            if not unchanged:
+                _df = _load_disk() if _save_disk(merged) else merged
+            if meta:
+                _meta = meta
+        _refreshed_at = time.time()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Views
+# ─────────────────────────────────────────────────────────────────────────────
+
+def daily(days=None):
+    """Daily OHLCV, optionally only the last `days` calendar days. Empty if unavailable."""
+    refresh()
+    df = _df
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLUMNS)
+    if days is not None:
+        # Positional slice keeps the result a view of the memory-mapped store
+        start = df.index.searchsorted(df.index[-1] - pd.Timedelta(days=days), side='right')
+        df = df.iloc[start:]
+    return df
+
+
+def weekly():
+    """Weekly close/volume resampled from the daily bars (Monday-start weeks, like Yahoo 1wk)."""
+    df = daily()
+    if df.empty:
+        return pd.DataFrame(columns=['close', 'volume'])
+    return (df.resample('W-MON', label='left', closed='left')
+              .agg({'close': 'last', 'volume': 'sum'})
+              .dropna(subset=['close']))
+
+
+def meta():
+    """Yahoo chart meta (regularMarketPrice, regularMarketVolume, ...) from the last fetch."""
+    refresh()
+    return dict(_meta)
+
+
+def pct_return(bars):
+    """Percent change over the last `bars` daily closes, or None if history is too short."""
+    close = daily()['close']
+    if len(close) < bars:
+        return None
+    start, end = float(close.iloc[-bars]), float(close.iloc[-1])
+    return (end - start) / start * 100 if start else 0
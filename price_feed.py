@@ -0,0 +1,169 @@
+"""
+Hedged live BTC price.
+Fires every price provider concurrently and answers from whichever come
+back first: once the first valid quote arrives, stragglers get a short
+grace window and the median of everything received is returned. Requests
+still in flight after that are abandoned (cancelled if not yet started),
+so one slow provider no longer sets the latency of the price strip.
+A provider whose previous request is still running is not asked again
+until it finishes; its last quote (if under QUOTE_MAX_AGE) stands in, so a
+hung provider can't pile requests up in the pool.
+"""
+
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import http_client
+import metrics
+import ratelimit
+
+HEDGE_TIMEOUT = 8.0    # give up entirely after this many seconds
+HEDGE_GRACE   = 0.3    # after the first valid quote, wait this long for others
+MIN_VALID_USD = 1000   # sanity floor for a BTC/USD quote
+QUOTE_MAX_AGE = 60.0   # seconds a busy provider's last quote may stand in for it
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Providers — each returns {'source', 'usd', 'chg_24h', 'aud', 'aud_chg_24h'}
+# (fields other than usd may be None) or None on failure.
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _quote(source, usd, chg_24h=None, aud=None, aud_chg_24h=None):
+    return {'source': source, 'usd': usd, 'chg_24h': chg_24h,
+            'aud': aud, 'aud_chg_24h': aud_chg_24h}
+
+
+def _coingecko():
+    r = http_client.get("https://api.coingecko.com/api/v3/simple/price",
+                        params={'ids': 'bitcoin', 'vs_currencies': 'usd,aud',
+                                'include_24hr_change': 'true'},
+                        timeout=6, retries=0, priority=ratelimit.LIVE)
+    if r.status_code != 200:
+        return None
+    d = r.json().get('bitcoin', {})
+    return _quote('coingecko', d.get('usd'), d.get('usd_24h_change'),
+                  d.get('aud'), d.get('aud_24h_change'))
+
+
+def _yahoo():
+    r = http_client.get("https://query1.finance.yahoo.com/v8/finance/chart/BTC-USD",
+                        params={'interval': '1d', 'range': '1d'}, timeout=6, retries=0)
+    if r.status_code != 200:
+        return None
+    meta = r.json()['chart']['result'][0]['meta']
+    price = meta.get('regularMarketPrice')
+    prev  = meta.get('chartPreviousClose')
+    chg   = ((price - prev) / prev * 100) if price and prev else None
+    return _quote('yahoo', price, chg)
+
+
+def _coinbase():
+    r = http_client.get("https://api.coinbase.com/v2/prices/BTC-USD/spot", timeout=6, retries=0)
+    if r.status_code != 200:
+        return None
+    return _quote('coinbase', float(r.json()['data']['amount']))
+
+
+PROVIDERS = [_coingecko, _yahoo, _coinbase]
+
+# Not a `with` block: leaving one would wait for abandoned requests to finish.
+# Headroom for providers passed to get_live_price() beyond PROVIDERS.
+_pool = ThreadPoolExecutor(max_workers=2 * len(PROVIDERS), thread_name_prefix='price-hedge')
+_inflight = {}      # provider → its latest Future, possibly abandoned and still running
+_last_quote = {}    # provider → (received_at, quote) of its latest valid quote
+_state_lock = threading.Lock()
+
+
+def _valid(q):
+    return q is not None and q.get('usd') is not None and float(q['usd']) >= MIN_VALID_USD
+
+
+def _safe(provider):
+    try:
+        return provider()
+    except Exception as e:
+        print(f"[price_feed] {provider.__name__.lstrip('_')}: {e}")
+        return None
+
+
+def _remember(provider, future):
+    if future.cancelled():
+        return
+    q = future.result()
+    if _valid(q):
+        with _state_lock:
+            _last_quote[provider] = (time.time(), q)
+
+
+def _submit(provider):
+    """Start a request to `provider`, or None if its previous one is still running."""
+    with _state_lock:
+        running = _inflight.get(provider)
+        if running is not None and not running.done():
+            return None
+        f = _pool.submit(metrics.carry(_safe), provider)
+        _inflight[provider] = f
+    f.add_done_callback(lambda f: _remember(provider, f))
+    return f
+
+
+def _recent_quote(provider):
+    with _state_lock:
+        at, q = _last_quote.get(provider, (0.0, None))
+    return q if time.time() - at < QUOTE_MAX_AGE else None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Hedged fetch
+# ─────────────────────────────────────────────────────────────────────────────
+
+def get_live_price(providers=None):
+    """
+    Returns {'usd', 'chg_24h', 'aud', 'aud_chg_24h', 'aud_rate', 'sources'} using
+    the median USD of the quotes that arrived, or None if no provider answered
+    in time. aud_rate comes from the quote that carried the AUD price.
+    """
+    providers = providers or PROVIDERS
+    pending, stand_ins = set(), []
+    for p in providers:
+        f = _submit(p)
+        if f is not None:
+            pending.add(f)
+        else:
+            q = _recent_quote(p)   # still busy with an abandoned request
+            if q is not None:
+                stand_ins.append(q)
+    quotes = []
+    deadline = time.time() + HEDGE_TIMEOUT
+    while pending:
+        remaining = deadline - time.time()
+        if quotes:
+            remaining = min(remaining, first_at + HEDGE_GRACE - time.time())
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for f in done:
+            q = f.result()
+            if _valid(q):
+                if not quotes:
+                    first_at = time.time()
+                quotes.append(q)
+    for f in pending:
+        f.cancel()
+
+    quotes += stand_ins
+    if not quotes:
+        return None
+    usd = statistics.median(float(q['usd']) for q in quotes)
+    chg = next((q['chg_24h'] for q in quotes if q['chg_24h'] is not None), None)
+    aud_q = next((q for q in quotes if q['aud']), None)
+    return {
+        'usd':         usd,
+        'chg_24h':     chg,
+        'aud':         aud_q['aud'] if aud_q else None,
+        'aud_chg_24h': aud_q['aud_chg_24h'] if aud_q else None,
+        'aud_rate':    aud_q['aud'] / float(aud_q['usd']) if aud_q else None,
+        'sources':     [q['source'] for q in quotes],
+    }
@@ -0,0 +1,160 @@
+"""
+Upstream provider registry.
+Backends are detected once at import: the Manus sandbox ApiClient is only
+registered if it can actually be imported here, so deployments without it
+(Railway) never pay for a failing import on every refresh. Each data kind
+has a small interface with providers tried in order; whichever provider
+last succeeded is tried first next time, so callers go straight to the
+working backend.
+
+Data kinds:
+    chart(symbol, ...)     Yahoo chart JSON    direct Yahoo v8, sandbox Yahoo
+    coin_history(days)     BTC daily closes    CoinGecko market_chart
+"""
+
+import sys
+import threading
+import time
+
+import cassette
+import http_client
+import ratelimit
+import source_cache
+
+SANDBOX_RUNTIME = '/opt/.manus/.sandbox-runtime'
+YAHOO_CHART_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/'
+YAHOO_HEADERS   = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+
+def range_covering(days):
+    """Smallest Yahoo range string covering `days` (the sandbox client only takes ranges)."""
+    for name, span in (('5d', 5), ('1mo', 30), ('3mo', 91), ('6mo', 182),
+                       ('1y', 365), ('2y', 730), ('5y', 1826)):
+        if days <= span:
+            return name
+    return '10y'
+
+
+def _has_chart(r):
+    return bool(r and r.get('chart', {}).get('result'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Providers
+# ─────────────────────────────────────────────────────────────────────────────
+
+class YahooDirect:
+    """Yahoo Finance v8 chart API over the shared HTTP client."""
+    name = 'yahoo-direct'
+
+    def chart(self, symbol, interval='1d', range_=None, period1=None, period2=None):
+        url = YAHOO_CHART_URL + symbol
+        params = {'interval': interval, 'includeAdjustedClose': 'true'}
+        if period1 is not None:
+            params['period1'] = int(period1)
+            params['period2'] = int(period2 or time.time())
+        else:
+            params['range'] = range_ or '1mo'
+
+        def fetch():
+            return http_client.get_json(url, params=params, timeout=20, headers=YAHOO_HEADERS,
+                                        validate=period1 is None)
+
+        # Explicit periods end at "now", so they would never hit the cache or revalidate
+        r = fetch() if period1 is not None else source_cache.read_through(url, params, fetch)
+        return r if _has_chart(r) else None
+
+
+class YahooSandbox:
+    """Yahoo chart via the Manus sandbox ApiClient (range-based queries only)."""
+    name = 'yahoo-sandbox'
+
+    def __init__(self, client):
+        self._client = client
+
+    def chart(self, symbol, interval='1d', range_=None, period1=None, period2=None):
+        if period1 is not None:
+            range_ = range_covering(int((time.time() - period1) // 86400) + 1)
+        r = self._client.call_api('YahooFinance/get_stock_chart', query={
+            'symbol': symbol, 'interval': interval, 'range': range_ or '1mo',
+            'includeAdjustedClose': True,
+        })
+        return r if _has_chart(r) else None
+
+
+class CoinGecko:
+    """CoinGecko market_chart: [[ms, close], ...] daily BTC/USD closes."""
+    name = 'coingecko'
+
+    def coin_history(self, days):
+        r = http_client.get('https://api.coingecko.com/api/v3/coins/bitcoin/market_chart',
+                            params={'vs_currency': 'usd', 'days': str(days), 'interval': 'daily'},
+                            timeout=20, priority=ratelimit.BACKFILL)
+        if r.status_code != 200:
+            return None
+        return r.json().get('prices') or None
+
+
+def _detect_sandbox():
+    """ApiClient instance if the sandbox runtime is importable here, else None."""
+    if SANDBOX_RUNTIME not in sys.path:
+        sys.path.append(SANDBOX_RUNTIME)
+    try:
+        from data_api import ApiClient
+        return ApiClient()
+    except Exception:
+        return None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Registry
+# ─────────────────────────────────────────────────────────────────────────────
+
+_registry = {}   # kind → [provider, ...] in try order
+_lock = threading.Lock()
+
+
+def register(kind, provider):
+    with _lock:
+        _registry.setdefault(kind, []).append(provider)
+
+
+def providers_for(kind):
+    """Names of the providers registered for `kind`, in the order they will be tried."""
+    return [p.name for p in _registry.get(kind, [])]
+
+
+def _call(kind, *args, **kwargs):
+    """First non-None result across the providers of `kind`; the winner moves to the front."""
+    for provider in list(_registry.get(kind, [])):
+        try:
+            result = getattr(provider, kind)(*args, **kwargs)
+        except Exception as e:
+            print(f"[providers] {provider.name} {kind}: {e}")
+            continue
+        if result is not None:
+            with _lock:
+                order = _registry[kind]
+                if order[0] is not provider:
+                    order.remove(provider)
+                    order.insert(0, provider)
+            return result
+    return None
+
+
+def chart(symbol, interval='1d', range_=None, period1=None, period2=None):
+    """Yahoo-format chart JSON for `symbol` (range string or epoch-second period), or None."""
+    return _call('chart', symbol, interval=interval, range_=range_, period1=period1, period2=period2)
+
+
+def coin_history(days):
+    """[[epoch_ms, close_usd], ...] daily BTC closes for the last `days` days, or None."""
+    return _call('coin_history', days)
+
+
+register('chart', YahooDirect())
+# The sandbox client bypasses http_client, so it's left out while a cassette is active
+_sandbox_client = None if cassette.active() else _detect_sandbox()
+if _sandbox_client is not None:
+    register('chart', YahooSandbox(_sandbox_client))
+register('coin_history', CoinGecko())
@@ -0,0 +1,131 @@
+"""
+Cross-process token-bucket rate limiter.
+The Streamlit app, the Telegram bot and the refresher all call CoinGecko
+independently and can't see each other's traffic. The bucket state for each
+limited host lives in a small JSON file under .ratelimit/, updated under an
+flock, so every process on the machine draws from the same budget.
+
+Requests carry a priority. Lower-priority requests may only take a token
+while enough remain for higher ones (RESERVE), so the live price keeps
+working while a long-history backfill waits. A request that can't get a
+token within its priority's MAX_WAIT raises RateLimitedError, which callers
+treat like any other connection failure and fall back.
+"""
+
+import json
+import os
+import threading
+import time
+
+import requests
+
+LIVE, NORMAL, BACKFILL = 0, 1, 2
+
+# host → (tokens per minute, bucket capacity)
+RATE_LIMITS = {
+    'api.coingecko.com': (10, 5),   # free tier allows ~10-30/min depending on load
+}
+
+RESERVE  = {LIVE: 0, NORMAL: 1, BACKFILL: 3}    # tokens left untouched for higher priorities
+MAX_WAIT = {LIVE: 2.0, NORMAL: 10.0, BACKFILL: 30.0}
+
+STATE_DIR = os.path.join(os.path.dirname(__file__), '.ratelimit')
+
+_thread_lock = threading.Lock()
+_mem_state = {}   # used when flock isn't available
+
+
+class RateLimitedError(requests.ConnectionError):
+    """Raised when no token could be taken for a rate-limited host in time."""
+
+
+def _state_path(host):
+    return os.path.join(STATE_DIR, host + '.json')
+
+
+def _update(host, fn):
+    """
+    Run fn(state) → result on the host's bucket state under a cross-process lock.
+    fn may mutate state in place; it is written back before the lock is released.
+    """
+    with _thread_lock:
+        try:
+            import fcntl
+        except ImportError:
+            state = _mem_state.setdefault(host, {})
+            return fn(state)
+        os.makedirs(STATE_DIR, exist_ok=True)
+        with open(_state_path(host), 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+                result = fn(state)
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _refill(state, rate, capacity, now):
+    tokens = state.get('tokens', capacity)
+    updated = state.get('updated', now)
+    state['tokens'] = min(capacity, tokens + (now - updated) * rate)
+    state['updated'] = now
+
+
+def is_limited(host):
+    return host in RATE_LIMITS
+
+
+def acquire(host, priority=NORMAL):
+    """
+    Take one token for `host`, sleeping until one is available. No-op for
+    hosts without a limit. Raises RateLimitedError after MAX_WAIT[priority].
+    """
+    if host not in RATE_LIMITS:
+        return
+    per_min, capacity = RATE_LIMITS[host]
+    rate = per_min / 60.0
+    reserve = RESERVE.get(priority, 0)
+    deadline = time.time() + MAX_WAIT.get(priority, MAX_WAIT[NORMAL])
+
+    def take(state):
+        now = time.time()
+        _refill(state, rate, capacity, now)
+        if now < state.get('blocked_until', 0):
+            return state['blocked_until'] - now
+        if state['tokens'] >= 1 + reserve:
+            state['tokens'] -= 1
+            return 0.0
+        return (1 + reserve - state['tokens']) / rate   # seconds until enough tokens
+
+    while True:
+        wait = _update(host, take)
+        if wait <= 0:
+            return
+        if time.time() + wait > deadline:
+            raise RateLimitedError(f"rate limit for {host}: no token within "
+                                   f"{MAX_WAIT.get(priority, MAX_WAIT[NORMAL]):.0f}s")
+        time.sleep(wait)
+
+
+def penalize(host, seconds):
+    """The host answered 429: empty the bucket and block every process for `seconds`."""
+    if host not in RATE_LIMITS:
+        return
+
+    def block(state):
+        now = time.time()
+        state['tokens'] = 0
+        state['updated'] = now
+        state['blocked_until'] = max(state.get('blocked_until', 0), now + seconds)
+
+    _update(host, block)
+    print(f"[ratelimit] {host} returned 429 — pausing all callers for {seconds:.0f}s")
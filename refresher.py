@@ -0,0 +1,331 @@
+"""
+Background Refresher — Indicator Snapshots
+Runs get_all_indicators → get_all_signals → transitions.update (the
+verdict, maintained from per-indicator zone changes) on a fixed schedule
+and publishes the result as a versioned snapshot file.
+app.py and telegram_bot.py only read the latest snapshot, so no user
+request waits on upstream APIs.
+
+A snapshot is never modified after it is written: each cycle writes a new
+file and atomically swaps it into place with os.replace(). Only one
+process runs the loop at a time (guarded by an flock on a lock file), and
+every build — the loop, or an app process revalidating a stale snapshot —
+holds a second flock so two processes never publish the same version.
+
+The heavy DataFrames from get_all_indicators (df_daily, df_weekly,
+fg_history) are dropped before publishing: no reader uses them, and app.py
+copies the snapshot through st.cache_data on every rerun.
+
+get_snapshot() is stale-while-revalidate: a snapshot older than
+STALE_AFTER is still returned immediately while a background refresh is
+kicked off; only past MAX_STALENESS does the caller block on a refresh.
+
+Running standalone:
+    python3 refresher.py          <- run the refresh loop in the foreground
+    python3 refresher.py once     <- publish one snapshot and exit
+"""
+
+import os
+import pickle
+import threading
+import time
+from datetime import datetime, timezone
+
+import transitions
+
+REFRESH_SECONDS = int(os.environ.get('REFRESH_SECONDS', '300'))
+STALE_AFTER     = 2 * REFRESH_SECONDS   # the scheduled refresh should have landed by now
+MAX_STALENESS   = int(os.environ.get('MAX_STALENESS', '1800'))
+SNAPSHOT_DIR    = os.path.join(os.path.dirname(__file__), '.snapshots')
+SNAPSHOT_FILE   = os.path.join(SNAPSHOT_DIR, 'latest.pkl')
+LOCK_FILE       = os.path.join(SNAPSHOT_DIR, 'refresher.lock')
+CYCLE_LOCK_FILE = os.path.join(SNAPSHOT_DIR, 'cycle.lock')     # held while one snapshot is built
+METRICS_FILE    = os.path.join(SNAPSHOT_DIR, 'metrics.json')   # per-source latency summary
+
+_cycle_lock = threading.Lock()
+_read_cache = {'stamp': None, 'snapshot': None}
+_lock_handle = None  # kept open for the life of the leader process
+
+# get_all_indicators() keys holding DataFrames. Nothing downstream reads them,
+# so they are left out of the snapshot pickled through st.cache_data.
+FRAME_KEYS = ('df_daily', 'df_weekly', 'fg_history')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Building snapshots
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _fetch_aud_rate():
+    """USD→AUD via Frankfurter (ECB data, no rate limits), open.er-api.com as backup."""
+    import http_client
+    for url in ("https://api.frankfurter.app/latest?from=USD&to=AUD",
+                "https://open.er-api.com/v6/latest/USD"):
+        try:
+            r = http_client.get(url)
+            if r.status_code == 200:
+                rate = r.json().get('rates', {}).get('AUD')
+                if rate:
+                    return rate
+        except Exception:
+            pass
+    return 1.58  # fallback
+
+
+def build_snapshot(version):
+    from data_fetcher import get_all_indicators, get_all_signals, compute_overall_verdict
+
+    data    = get_all_indicators()
+    signals = get_all_signals(data)
+    try:
+        moved, verdict, transition_seq = transitions.update(signals)
+    except Exception as e:
+        print(f"[refresher] Transition tracking failed, recounting verdict: {e}")
+        moved, verdict, transition_seq = [], compute_overall_verdict(signals), None
+
+    aud_rate = _fetch_aud_rate()
+    data['aud_rate']       = aud_rate
+    data['price_aud']      = data['price'] * aud_rate
+    data['market_cap_aud'] = data.get('market_cap', 0) * aud_rate
+
+    created_ts = time.time()
+    data['as_of_ts'] = created_ts
+
+    for k in FRAME_KEYS:
+        data.pop(k, None)
+
+    snapshot = {
+        'version':    version,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'created_ts': created_ts,
+        'data':       data,
+        'signals':    signals,
+        'verdict':    verdict,   # (verdict, color, score, buy_n, caution_n, sell_n)
+        'transitions': moved,    # indicators whose zone changed this cycle
+        'transition_seq': transition_seq,   # tracker seq this snapshot's verdict reflects
+    }
+    return snapshot
+
+
+def _write_atomic(path, obj, version):
+    tmp = path + '.' + str(version) + '.' + str(os.getpid()) + '.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def publish(snapshot):
+    """Write the snapshot to a temp file and atomically swap it into place."""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    _write_atomic(SNAPSHOT_FILE, snapshot, snapshot['version'])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reading snapshots
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _read_cached(path, cache):
+    """Unpickle `path`, reusing the previous object until a newer file is swapped in."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    if cache['stamp'] == stamp:
+        return cache['snapshot']
+    try:
+        with open(path, 'rb') as f:
+            obj = pickle.load(f)
+    except Exception as e:
+        print(f"[refresher] Could not read {os.path.basename(path)}: {e}")
+        return cache['snapshot']
+    cache['stamp'] = stamp
+    cache['snapshot'] = obj
+    return obj
+
+
+def read_snapshot():
+    """
+    Return the latest published snapshot dict, or None if none exists yet.
+    The unpickled object is reused until a newer file is swapped in; treat it
+    as read-only.
+    """
+    return _read_cached(SNAPSHOT_FILE, _read_cache)
+
+
+def snapshot_age(snapshot):
+    """Seconds since the snapshot was built."""
+    return time.time() - snapshot.get('created_ts', 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Refresh cycle
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _lock_cycle(blocking=True):
+    """
+    Cross-process lock around building + publishing one snapshot, so the
+    leader loop and any app process revalidating never build the same version.
+    Returns the open handle, or None if `blocking` is False and another
+    process holds it.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return True  # no flock on this platform; the thread lock is all we have
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    handle = open(CYCLE_LOCK_FILE, 'a')
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+def _unlock_cycle(handle):
+    if handle is not True:
+        handle.close()   # closing the descriptor releases the flock
+
+
+def refresh_once(blocking=True, max_age=None):
+    """
+    Build and publish one snapshot. Returns it.
+    blocking=False returns None instead of waiting when another thread or
+    process is already refreshing. With max_age, a snapshot published while
+    waiting for the lock that is younger than max_age is returned instead of
+    building another.
+    """
+    if not _cycle_lock.acquire(blocking=blocking):
+        return None
+    try:
+        handle = _lock_cycle(blocking)
+        if handle is None:
+            return None
+        try:
+            prev = read_snapshot()
+            if max_age is not None and prev is not None and snapshot_age(prev) < max_age:
+                return prev
+            version = (prev['version'] + 1) if prev else 1
+            t0 = time.time()
+            snapshot = build_snapshot(version)
+            publish(snapshot)
+            print(f"[refresher] Published snapshot v{version} in {time.time() - t0:.1f}s")
+            _dump_metrics()
+            return snapshot
+        finally:
+            _unlock_cycle(handle)
+    finally:
+        _cycle_lock.release()
+
+
+def _dump_metrics():
+    """Write the per-source latency summary and log the slowest fetcher."""
+    import metrics
+    try:
+        metrics.dump_json(METRICS_FILE)
+        fetch = metrics.summary('fetch')
+        if fetch:
+            name, s = next(iter(fetch.items()))
+            print(f"[refresher] Slowest source: {name} p95={s['p95_ms']:.0f}ms "
+                  f"(errors={s['errors']}, fallbacks={s['fallbacks']})")
+    except Exception as e:
+        print(f"[refresher] Could not write metrics: {e}")
+
+
+def latest_or_refresh():
+    """Latest snapshot; on a cold start with nothing published yet, build one now."""
+    snapshot = read_snapshot()
+    if snapshot is not None:
+        return snapshot
+    # Waits for a build already running anywhere and returns its snapshot
+    return refresh_once(max_age=MAX_STALENESS)
+
+
+def _refresh_quietly():
+    try:
+        if refresh_once(blocking=False, max_age=STALE_AFTER) is None:
+            print("[refresher] Revalidate skipped — another refresh is running")
+    except Exception as e:
+        print(f"[refresher] Revalidate failed: {e}")
+
+
+def refresh_async():
+    """Start one refresh in a daemon thread unless a refresh is already running."""
+    if _cycle_lock.locked():
+        return None
+    t = threading.Thread(target=_refresh_quietly, daemon=True, name='refresher-revalidate')
+    t.start()
+    return t
+
+
+def get_snapshot():
+    """
+    Stale-while-revalidate read of the latest snapshot.
+    - fresh (< STALE_AFTER):            returned as-is
+    - stale (< MAX_STALENESS):          returned now, refresh started in background
+    - too stale / missing:              refreshed synchronously (falls back to the
+                                        stale snapshot if that refresh fails)
+    """
+    snapshot = read_snapshot()
+    if snapshot is None:
+        return latest_or_refresh()
+    age = snapshot_age(snapshot)
+    if age < STALE_AFTER:
+        return snapshot
+    if age < MAX_STALENESS:
+        refresh_async()
+        return snapshot
+    try:
+        # Waits for a concurrent build (here or in the leader) rather than duplicating it
+        return refresh_once(max_age=MAX_STALENESS)
+    except Exception as e:
+        print(f"[refresher] Blocking refresh failed, serving stale snapshot: {e}")
+        return snapshot
+
+
+def run_forever():
+    while True:
+        try:
+            refresh_once()
+        except Exception as e:
+            print(f"[refresher] Cycle failed: {e}")
+        time.sleep(REFRESH_SECONDS)
+
+
+def _acquire_leader_lock():
+    """Non-blocking flock so only one process (Streamlit or standalone) refreshes."""
+    global _lock_handle
+    try:
+        import fcntl
+    except ImportError:
+        return True  # no flock on this platform; assume single process
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    handle = open(LOCK_FILE, 'a')
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+    _lock_handle = handle
+    return True
+
+
+def start_background():
+    """Start the refresh loop in a daemon thread if no other process is running it."""
+    if not _acquire_leader_lock():
+        print("[refresher] Another process is already refreshing — reading snapshots only.")
+        return None
+    t = threading.Thread(target=run_forever, daemon=True, name='refresher')
+    t.start()
+    return t
+
+
+if __name__ == "__main__":
+    import sys
+    args = sys.argv[1:]
+    if args and args[0] == "once":
+        refresh_once()
+    elif _acquire_leader_lock():
+        run_forever()
+    else:
+        print("[refresher] Another process is already refreshing. Exiting.")
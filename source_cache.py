@@ -0,0 +1,121 @@
+"""
+Tiered TTL cache for upstream JSON responses.
+Entries are keyed by URL + params and persisted under .source_cache/ so a
+restart does not cold-fetch every source. Each source gets its own TTL:
+price feeds are short-lived, while weekly FRED balance sheets and daily
+CBBI / Fear & Greed readings are kept for hours.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlencode
+
+import cassette
+import metrics
+
+CACHE_DIR = cassette.isolated_dir(os.path.join(os.path.dirname(__file__), '.source_cache'))
+
+# (substring of the cache key, ttl_seconds) — first match wins.
+SOURCE_TTLS = [
+    ('series_id=WALCL',               12 * 3600),   # Fed balance sheet, weekly
+    ('series_id=ECBASSETSW',          12 * 3600),   # ECB balance sheet, weekly
+    ('series_id=JPNASSETS',           12 * 3600),   # BoJ balance sheet, monthly
+    ('api.stlouisfed.org',             6 * 3600),   # FRED FX rates, daily
+    ('colintalkscrypto.com/cbbi',      6 * 3600),   # CBBI, daily
+    ('api.alternative.me/fng',         3 * 3600),   # Fear & Greed, daily
+    ('api.alternative.me/v2',          3600),       # Altcoin season index
+    ('open-api.coinglass.com',         3600),       # On-chain indicators
+    ('query1.finance.yahoo.com',       240),
+    ('api.coingecko.com',              240),
+]
+DEFAULT_TTL = 240
+MAX_STALE   = 7 * 86400   # oldest entry still served when the upstream is failing
+
+_SECRET_PARAMS = {'api_key'}
+
+_mem = {}
+_lock = threading.Lock()
+
+
+def cache_key(url, params=None):
+    """Canonical URL + sorted params, with secrets stripped."""
+    if not params:
+        return url
+    items = sorted((k, v) for k, v in params.items() if k not in _SECRET_PARAMS)
+    return url + ('&' if '?' in url else '?') + urlencode(items, doseq=True)
+
+
+def ttl_for(key):
+    for pattern, ttl in SOURCE_TTLS:
+        if pattern in key:
+            return ttl
+    return DEFAULT_TTL
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+
+def _load(key):
+    entry = _mem.get(key)
+    if entry is not None:
+        return entry
+    try:
+        with open(_path(key)) as f:
+            entry = json.load(f)
+    except Exception:
+        return None
+    _mem[key] = entry
+    return entry
+
+
+def get(key, max_age=None):
+    """Return the cached value if younger than max_age (default: its TTL), else None."""
+    if max_age is None:
+        max_age = ttl_for(key)
+    with _lock:
+        entry = _load(key)
+    if entry and time.time() - entry['fetched_at'] < max_age:
+        return entry['data']
+    return None
+
+
+def put(key, data):
+    entry = {'key': key, 'fetched_at': time.time(), 'data': data}
+    with _lock:
+        _mem[key] = entry
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, _path(key))
+        except Exception as e:
+            print(f"[source_cache] Failed to save {key}: {e}")
+
+
+def read_through(url, params, fetch):
+    """
+    Return a fresh cached response for url+params, or call fetch() and cache it.
+    fetch() returns decoded JSON or None on failure; failures are not cached,
+    and an entry up to MAX_STALE old is served instead when one exists.
+    """
+    key = cache_key(url, params)
+    cached = get(key)
+    if cached is not None:
+        metrics.record('cache', url, cache='hit')
+        return cached
+    data = fetch()
+    if data is not None:
+        put(key, data)
+        metrics.record('cache', url, cache='miss')
+        return data
+    stale = get(key, max_age=MAX_STALE)
+    if stale is not None:
+        print(f"[source_cache] Serving stale {key}")
+    metrics.record('cache', url, cache='stale' if stale is not None else 'miss',
+                   fallback=stale is not None)
+    return stale
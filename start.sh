@@ -5,6 +5,12 @@ python3 telegram_bot.py &
 BOT_PID=$!
 echo "Telegram bot started with PID $BOT_PID"
 
+# Start the indicator refresher in the background (publishes snapshots)
+echo "Starting refresher..."
+python3 refresher.py &
+REFRESHER_PID=$!
+echo "Refresher started with PID $REFRESHER_PID"
+
 # Start Streamlit in the foreground
 echo "Starting Streamlit..."
 streamlit run app.py --server.port=${PORT:-8501} --server.address=0.0.0.0 --server.headless=true
@@ -18,9 +18,11 @@ Running standalone:
 """
 
 import os
+import html
 import json
 import time
 import requests
+import http_client
 from datetime import datetime
 
 BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
@@ -147,12 +149,12 @@ def send_message(chat_id, text, parse_mode="HTML"):
         return False
     try:
         url = "https://api.telegram.org/bot" + BOT_TOKEN + "/sendMessage"
-        r = requests.post(url, json={
+        r = http_client.post(url, json={
             "chat_id": chat_id,
             "text": text,
             "parse_mode": parse_mode,
             "disable_web_page_preview": True
-        }, timeout=10)
+        })
         if r.status_code != 200:
             print("[Telegram] Send failed (" + str(r.status_code) + "): " + r.text[:200])
         return r.status_code == 200
@@ -186,6 +188,8 @@ SIGNAL_EMOJI = {
     "High Risk Zone":    "🔴",
 }
 
+SIGNAL_ZONE_EMOJI = {"BUY": "🟢", "CAUTION": "🟡", "SELL": "🔴"}
+
 
 def _load_cache():
     if os.path.exists(SIGNAL_CACHE_FILE):
@@ -198,41 +202,37 @@ def _load_cache():
 
 
 def _fetch_live_price():
-    """Fetch live BTC price directly from CoinGecko — used when cache is stale."""
+    """Fetch the live BTC price from the hedged price feed — used when cache is stale."""
     try:
-        r = requests.get(
-            "https://api.coingecko.com/api/v3/simple/price",
-            params={"ids": "bitcoin", "vs_currencies": "usd", "include_24hr_change": "true"},
-            timeout=10,
-            headers={"User-Agent": "Mozilla/5.0"}
-        )
-        if r.status_code == 200:
-            data = r.json().get("bitcoin", {})
-            return data.get("usd"), data.get("usd_24h_change", 0)
+        from price_feed import get_live_price
+        live = get_live_price()
+        if live:
+            return live["usd"], live["chg_24h"] or 0
     except Exception as e:
         print("[Telegram] Live price fetch error: " + str(e))
     return None, None
 
 
 def _fetch_live_signals():
-    """Fetch fresh signal data directly from data_fetcher.
-    Returns (verdict, score, buy_n, caution_n, sell_n, price) or None on failure."""
+    """Read the latest snapshot published by refresher.py.
+    Returns (verdict, score, buy_n, caution_n, sell_n, price) or None if none is available."""
     try:
         import sys as _sys
         _sys.path.insert(0, os.path.dirname(__file__))
-        from data_fetcher import get_all_indicators, get_all_signals, compute_overall_verdict
-        data    = get_all_indicators()
-        signals = get_all_signals(data)
-        verdict, _, score, buy_n, caution_n, sell_n = compute_overall_verdict(signals)
-        price = data.get('price', 0)
+        from refresher import read_snapshot
+        snap = read_snapshot()
+        if snap is None:
+            return None
+        verdict, _, score, buy_n, caution_n, sell_n = snap['verdict']
+        price = snap['data'].get('price', 0)
         return verdict, score, buy_n, caution_n, sell_n, price
     except Exception as e:
-        print("[Telegram] Live signal fetch error: " + str(e))
+        print("[Telegram] Snapshot read error: " + str(e))
         return None
 
 
 def _build_signal_message():
-    # Try to get fully fresh live data first
+    # Latest published snapshot first
     live = _fetch_live_signals()
     if live:
         verdict, score, buy_n, caution_n, sell_n, price = live
@@ -284,7 +284,8 @@ def _build_signal_message():
     return "\n".join(lines)
 
 
-def send_signal_change_alert(verdict, score, buy_n, caution_n, sell_n, price, summary=""):
+def send_signal_change_alert(verdict, score, buy_n, caution_n, sell_n, price, summary="", drivers=None):
+    """drivers: transitions.net_moves() entries — the indicators that changed zone."""
     emoji = SIGNAL_EMOJI.get(verdict, "⚪")
     lines = [
         "🔔 <b>BTCpulse — Signal Changed</b>",
@@ -293,6 +294,12 @@ def send_signal_change_alert(verdict, score, buy_n, caution_n, sell_n, price, su
         "🟢 " + str(buy_n) + " Value  🟡 " + str(caution_n) + " Neutral  🔴 " + str(sell_n) + " Risk  <i>(" + str(int(buy_n)+int(caution_n)+int(sell_n)) + " indicators)</i>",
         "💰 BTC: <b>$" + "{:,.0f}".format(float(price)) + "</b>",
     ]
+    if drivers:
+        lines += ["", "<b>What moved:</b>"]
+        for t in drivers[:6]:
+            lines.append("• " + html.escape(str(t["name"])) + ": " + SIGNAL_ZONE_EMOJI.get(t["from"], "") + " → "
+                         + SIGNAL_ZONE_EMOJI.get(t["to"], "") + " (" + html.escape(str(t["from_str"])) + " → "
+                         + html.escape(str(t["to_str"])) + ")")
     if summary:
         lines += ["", "<i>" + str(summary) + "</i>"]
     lines += [
@@ -417,7 +424,9 @@ def poll_updates(offset=None):
         params = {"timeout": 30, "allowed_updates": ["message"]}
         if offset is not None:
             params["offset"] = offset
-        r = requests.get(url, params=params, timeout=40)
+        # Long-poll: no retries, an empty timeout is the normal outcome. Kept off
+        # the api.telegram.org breaker so a quiet poll can't block sendMessage.
+        r = http_client.get(url, params=params, timeout=40, retries=0, breaker=False)
         if r.status_code == 200:
             return r.json().get("result", [])
         else:
@@ -0,0 +1,232 @@
+"""
+Per-indicator zone transitions and the incrementally maintained verdict.
+Each refresh cycle feeds its signals to update(). Only indicators whose zone
+moved between BUY / CAUTION / SELL touch the running counts, and every move
+is appended to a bounded log with when it happened and the value it moved
+from. The verdict is derived from those counts (verdict_from_counts), so it
+always equals compute_overall_verdict() over the same signals without
+recounting them.
+
+Alerts and the AI change explanation read the log (since(), net_moves(),
+describe()) to cite the indicators that actually drove a verdict change.
+
+State is one JSON file under .snapshots/, written atomically by whichever
+process runs the refresh cycle. update() holds an flock on a sibling lock
+file for the whole load → apply → save, so two processes never fold
+signals into the same stale copy; readers only load it.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+STATE_DIR  = os.path.join(os.path.dirname(__file__), '.snapshots')
+STATE_FILE = os.path.join(STATE_DIR, 'transitions.json')
+LOCK_FILE  = STATE_FILE + '.lock'
+LOG_SIZE   = 500      # most recent transitions kept
+ZONES      = ('BUY', 'CAUTION', 'SELL')
+
+_lock = threading.Lock()
+_read_cache = {'stamp': None, 'tracker': None}
+
+
+def _plain(value):
+    """JSON-safe copy of a signal value (numpy scalars → float)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+class ZoneTracker:
+    """Current zone per indicator, running zone counts and the transition log."""
+
+    def __init__(self):
+        self.zones = {}                        # name → 'BUY' | 'CAUTION' | 'SELL'
+        self.values = {}                       # name → [value, value_str] at the last update
+        self.counts = dict.fromkeys(ZONES, 0)
+        self.log = deque(maxlen=LOG_SIZE)
+        self.seq = 0                           # seq of the newest logged transition
+        self.updated_at = None
+
+    def apply(self, signals, ts=None):
+        """
+        Fold one cycle's signals in. Returns the transitions it produced.
+        An indicator seen for the first time (or dropped) adjusts the counts
+        but is not a transition.
+        """
+        ts = time.time() if ts is None else ts
+        moved = []
+        seen = set()
+        for s in signals:
+            name, zone = s['name'], s['signal']
+            seen.add(name)
+            old = self.zones.get(name)
+            if old is None:
+                self.counts[zone] += 1
+            elif old != zone:
+                self.counts[old] -= 1
+                self.counts[zone] += 1
+                self.seq += 1
+                from_value, from_str = self.values[name]
+                moved.append({
+                    'seq':        self.seq,
+                    'at':         ts,
+                    'name':       name,
+                    'from':       old,
+                    'to':         zone,
+                    'from_value': from_value,
+                    'to_value':   _plain(s['value']),
+                    'from_str':   from_str,
+                    'to_str':     s['value_str'],
+                })
+            self.zones[name] = zone
+            self.values[name] = [_plain(s['value']), s['value_str']]
+        for name in [n for n in self.zones if n not in seen]:
+            self.counts[self.zones.pop(name)] -= 1
+            self.values.pop(name, None)
+        self.log.extend(moved)
+        self.updated_at = ts
+        return moved
+
+    def verdict(self):
+        """(verdict, color, score, buy_n, caution_n, sell_n) from the running counts."""
+        from data_fetcher import verdict_from_counts
+        return verdict_from_counts(self.counts['BUY'], self.counts['CAUTION'], self.counts['SELL'])
+
+    def since(self, seq, upto=None):
+        """Logged transitions after `seq`, up to and including `upto`; none if seq is unknown."""
+        if seq is None:
+            return []
+        return [t for t in self.log
+                if t['seq'] > seq and (upto is None or t['seq'] <= upto)]
+
+    # ── Persistence ──
+
+    def to_dict(self):
+        return {'zones': self.zones, 'values': self.values, 'counts': self.counts,
+                'log': list(self.log), 'seq': self.seq, 'updated_at': self.updated_at}
+
+    @classmethod
+    def from_dict(cls, d):
+        t = cls()
+        t.zones = dict(d.get('zones', {}))
+        t.values = dict(d.get('values', {}))
+        t.log.extend(d.get('log', []))
+        t.seq = d.get('seq', 0)
+        t.updated_at = d.get('updated_at')
+        # Counts are derived state; rebuild them rather than trust a damaged file
+        t.counts = dict.fromkeys(ZONES, 0)
+        for zone in t.zones.values():
+            t.counts[zone] += 1
+        return t
+
+
+def _load():
+    try:
+        with open(STATE_FILE) as f:
+            return ZoneTracker.from_dict(json.load(f))
+    except FileNotFoundError:
+        return ZoneTracker()
+    except Exception as e:
+        print(f"[transitions] Could not load state, starting fresh: {e}")
+        return ZoneTracker()
+
+
+def _save(tracker):
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        tmp = f"{STATE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(tracker.to_dict(), f)
+        os.replace(tmp, STATE_FILE)
+    except Exception as e:
+        print(f"[transitions] Could not save state: {e}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Writer (refresh cycle)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _lock_state():
+    """Exclusive flock across processes for one update. Returns the handle to close."""
+    try:
+        import fcntl
+    except ImportError:
+        return None  # no flock on this platform; the thread lock is all we have
+    os.makedirs(STATE_DIR, exist_ok=True)
+    handle = open(LOCK_FILE, 'a')
+    fcntl.flock(handle, fcntl.LOCK_EX)
+    return handle
+
+
+def update(signals):
+    """
+    Apply one cycle's signals to the persisted tracker.
+    Returns (transitions this cycle, verdict tuple from the running counts,
+    tracker seq after this cycle).
+    """
+    with _lock:
+        handle = _lock_state()
+        try:
+            tracker = _load()   # re-read: another process may have refreshed since
+            moved = tracker.apply(signals)
+            _save(tracker)
+        finally:
+            if handle is not None:
+                handle.close()   # releases the flock
+        if moved:
+            print(f"[transitions] {len(moved)} zone change(s): {describe(moved, limit=5)}")
+        return moved, tracker.verdict(), tracker.seq
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Readers (alerts, app)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def read():
+    """The persisted tracker, reloaded only when the file changes. Treat as read-only."""
+    try:
+        st = os.stat(STATE_FILE)
+    except FileNotFoundError:
+        return ZoneTracker()
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    if _read_cache['stamp'] != stamp:
+        _read_cache['tracker'] = _load()
+        _read_cache['stamp'] = stamp
+    return _read_cache['tracker']
+
+
+def since(seq, upto=None):
+    """
+    Transitions logged after `seq`, up to and including `upto` (pass the
+    snapshot's transition_seq so moves from a newer, unpublished cycle are not
+    cited). Empty when seq is None: there is no baseline to compare against.
+    """
+    return read().since(seq, upto)
+
+
+def net_moves(transitions):
+    """
+    Collapse a run of transitions to one per indicator (first 'from' → last 'to'),
+    dropping indicators that ended where they started. Oldest first.
+    """
+    net = {}
+    for t in transitions:
+        if t['name'] in net:
+            net[t['name']].update(to=t['to'], to_value=t['to_value'], to_str=t['to_str'],
+                                  seq=t['seq'], at=t['at'])
+        else:
+            net[t['name']] = dict(t)
+    return [t for t in net.values() if t['from'] != t['to']]
+
+
+def describe(transitions, limit=None):
+    """'MVRV Z-Score CAUTION → BUY (2.41 → -0.12); ...' for prompts, alerts and logs."""
+    parts = [f"{t['name']} {t['from']} → {t['to']} ({t['from_str']} → {t['to_str']})"
+             for t in transitions[:limit]]
+    return '; '.join(parts)